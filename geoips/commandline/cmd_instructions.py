@@ -8,7 +8,6 @@ Used to dynamically load and apply help information to all 'geoips' commands.
 
 import json
 from os.path import dirname, exists, getmtime
-import yaml
 
 
 def instructions_modified(ancillary_dirname, fname="cmd_instructions.yaml"):
@@ -82,7 +81,10 @@ def get_instructions(ancillary_dirname=None, fname="cmd_instructions.yaml"):
         # JSON Command Instructions don't exist yet or yaml instructions were recently
         # modified; load in the YAML Command Instructions and dump those to a JSON File,
         # but just assign the instructions to what we loaded from the yaml file since
-        # they already exist in memory
+        # they already exist in memory. yaml is only imported here as the JSON file
+        # is used on every other call.
+        import yaml
+
         with open(
             f"{ancillary_dirname}/{fname}",
             "r",
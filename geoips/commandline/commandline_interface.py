@@ -7,20 +7,13 @@ Will implement a plethora of commands, but for the meantime, we'll work on
 'geoips list' and 'geoips run'
 """
 
+from functools import cached_property
+from importlib import import_module
 from os.path import basename
 import sys
 
-from colorama import Fore, Style
-
-from geoips.commandline.cmd_instructions import get_instructions
+from geoips.commandline.cmd_instructions import alias_mapping, get_instructions
 from geoips.commandline.geoips_command import GeoipsCommand
-from geoips.commandline.geoips_config import GeoipsConfig
-from geoips.commandline.geoips_describe import GeoipsDescribe
-from geoips.commandline.geoips_list import GeoipsList
-from geoips.commandline.geoips_run import GeoipsRun
-from geoips.commandline.geoips_test import GeoipsTest
-from geoips.commandline.geoips_tree import GeoipsTree
-from geoips.commandline.geoips_validate import GeoipsValidate
 
 
 class GeoipsCLI(GeoipsCommand):
@@ -28,19 +21,72 @@ class GeoipsCLI(GeoipsCommand):
 
     This class includes a list of Command Classes, which will implement the core
     functionality of the CLI. This includes the following as of right now:
-    - [GeoipsConfig, GeoipsGet, GeoipsList, GeoipsRun, GeoipsTest, GeoipsValidate]
+    - [GeoipsConfig, GeoipsDescribe, GeoipsList, GeoipsRun, GeoipsTest, GeoipsTree,
+      GeoipsValidate]
     """
 
     name = "geoips"  # Needed since we inherit from GeoipsCommand
-    command_classes = [
-        GeoipsConfig,
-        GeoipsDescribe,
-        GeoipsList,
-        GeoipsRun,
-        GeoipsTest,
-        GeoipsTree,
-        GeoipsValidate,
-    ]
+    # Mapping of each top-level command to the "<module>:<class>" which implements it.
+    # Modules are only imported once we know which command was requested, see
+    # 'command_classes' below.
+    command_class_paths = {
+        "config": "geoips.commandline.geoips_config:GeoipsConfig",
+        "describe": "geoips.commandline.geoips_describe:GeoipsDescribe",
+        "list": "geoips.commandline.geoips_list:GeoipsList",
+        "run": "geoips.commandline.geoips_run:GeoipsRun",
+        "test": "geoips.commandline.geoips_test:GeoipsTest",
+        "tree": "geoips.commandline.geoips_tree:GeoipsTree",
+        "validate": "geoips.commandline.geoips_validate:GeoipsValidate",
+    }
+    # Commands which operate on the entire CLI (ie. 'geoips tree' which displays every
+    # command), and therefore always require every command class to be initialized.
+    full_cli_commands = ["tree"]
+
+    @cached_property
+    def command_classes(self):
+        """List of top-level Command Classes needed for the requested command.
+
+        Most CLI calls only make use of a single top-level command, so only that
+        command's module is imported and initialized. If no valid command could be
+        identified from sys.argv (ie. 'geoips -h' or an invalid command), every
+        command class is imported so argparse can output the full help / error message.
+        The same is done for commands found in 'full_cli_commands'.
+        """
+        requested_command = self._get_requested_command()
+        if requested_command and requested_command not in self.full_cli_commands:
+            class_paths = [self.command_class_paths[requested_command]]
+        else:
+            class_paths = self.command_class_paths.values()
+        command_classes = []
+        for class_path in class_paths:
+            module_name, class_name = class_path.split(":")
+            command_classes.append(getattr(import_module(module_name), class_name))
+        return command_classes
+
+    def _get_requested_command(self):
+        """Return the name of the top-level command provided in sys.argv, if any.
+
+        Aliases of commands (ie. 'ls' for 'list') are resolved to the command's name.
+
+        Returns
+        -------
+        command_name: str or None
+            - The name of the requested top-level command, or None if a valid command
+              was not provided.
+        """
+        args = sys.argv[1:]
+        idx = 0
+        # Skip over the log level flags, which may be placed before the command
+        while idx < len(args) and args[idx] in ["--log-level", "-log"]:
+            idx += 2
+        if idx >= len(args) or args[idx].startswith("-"):
+            return None
+        for command_name in self.command_class_paths:
+            if args[idx] == command_name or args[idx] in alias_mapping.get(
+                command_name, []
+            ):
+                return command_name
+        return None
 
     def __init__(self, instructions_dir=None, legacy=False):
         """Initialize the GeoipsCLI and each of it's command classes.
@@ -176,6 +222,8 @@ def support_legacy_procflows():
 
 def print_beta_warning():
     """Notify the user that the CLI is still in Beta development stage."""
+    from colorama import Fore, Style
+
     print(
         Fore.RED
         + "\nWARNING: "
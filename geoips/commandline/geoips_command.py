@@ -10,17 +10,104 @@ Will implement a plethora of commands, but for the meantime, we'll work on
 
 import abc
 import argparse
-from importlib import metadata, resources
-import json
-from os.path import dirname
+from importlib import resources
+from os.path import dirname, getmtime
 from shutil import get_terminal_size
 
-from colorama import Fore, Style
-from tabulate import tabulate
-import yaml
-
 from geoips.commandline.cmd_instructions import cmd_instructions, alias_mapping
 from geoips.commandline.log_setup import setup_logging
+from geoips.geoips_utils import get_entry_point_group
+from geoips.plugin_registry import get_registry_path, load_registry_json
+
+# Parsed 'registered_plugins.json' files keyed by package name, stored alongside the
+# modification time of the file when it was read. A single CLI call can query many
+# interfaces from the same package, so only read each registry once unless it changed.
+_REGISTRY_CACHE = {}
+
+
+def _load_package_registry(package_name):
+    """Load the 'registered_plugins.json' of a package, caching the result.
+
+    Parameters
+    ----------
+    package_name: str
+        - The name of the GeoIPS plugin package whose registry will be loaded.
+
+    Returns
+    -------
+    registry: dict
+        - The full plugin registry of the requested package.
+    """
+    reg_path = get_registry_path(package_name)
+    reg_mtime = getmtime(reg_path)
+    cached = _REGISTRY_CACHE.get(package_name)
+    if cached is None or cached[0] != reg_mtime:
+        cached = (reg_mtime, load_registry_json(reg_path))
+        _REGISTRY_CACHE[package_name] = cached
+    return cached[1]
+
+
+def _format_key(key):
+    """Format a dictionary key into the human readable form shown by describe."""
+    key = str(key).title().replace("_", " ")
+    if key in ["Package", "Geoips Package"]:
+        key = "GeoIPS Package"
+    elif key == "Relpath":
+        key = "Relative Path"
+    return key
+
+
+def _format_scalar(value):
+    """Format a scalar value the same way yaml would represent it."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def _emit_colored(dict_entry, colors, depth=0):
+    """Yield colorized, yaml-like lines representing the provided dictionary.
+
+    This only supports the subset of yaml needed for outputting plugin registry and
+    describe entries, which are mappings of scalars, lists, and nested mappings. Keys
+    are colored cyan and values are colored yellow. Continuation lines and list items
+    are tab-indented, as they were when this output was generated via yaml.dump.
+
+    Parameters
+    ----------
+    dict_entry: dict
+        - The dictionary to format.
+    colors: tuple of str
+        - The (key, value, reset) terminal color codes.
+    depth: int, optional
+        - The nesting level of dict_entry, used for indentation.
+
+    Yields
+    ------
+    line: str
+        - A single colorized line of output.
+    """
+    cyan, yellow, reset = colors
+    indent = "  " * depth
+    for key, value in sorted(dict_entry.items(), key=lambda item: str(item[0])):
+        key = indent + _format_key(key)
+        if isinstance(value, dict) and value:
+            yield f"{cyan}{key}:{reset}"
+            yield from _emit_colored(value, colors, depth + 1)
+        elif isinstance(value, (list, tuple)) and value:
+            yield f"{cyan}{key}:{reset}"
+            for item in value:
+                if isinstance(item, dict) and item:
+                    yield f"\t{yellow}{indent}-{reset}"
+                    yield from _emit_colored(item, colors, depth + 1)
+                else:
+                    yield f"\t{yellow}{indent}- {_format_scalar(item)}{reset}"
+        else:
+            first_line, *other_lines = _format_scalar(value).split("\n")
+            yield f"{cyan}{key}:{reset}{yellow} {first_line}{reset}"
+            for line in other_lines:
+                yield f"\t{yellow}{indent}  {line}{reset}"
 
 
 class PluginPackages:
@@ -40,14 +127,12 @@ class PluginPackages:
         Initialize the plugin packages and their paths. This is done by using the
         get_plugin_packages() and get_plugin_package_paths() functions.
         """
+        # Only enumerate the installed distributions' entry points once, both the
+        # names and paths of the plugin packages are derived from the same list.
         self.entrypoints = [
-            ep.value
-            for ep in sorted(metadata.entry_points(group="geoips.plugin_packages"))
-        ]
-        self.paths = [
-            dirname(resources.files(ep.value))
-            for ep in sorted(metadata.entry_points(group="geoips.plugin_packages"))
+            ep.value for ep in sorted(get_entry_point_group("geoips.plugin_packages"))
         ]
+        self.paths = [dirname(resources.files(pkg)) for pkg in self.entrypoints]
 
 
 plugin_packages = PluginPackages()
@@ -182,20 +267,15 @@ class GeoipsCommand(abc.ABC):
                 # add thoss aliases to the parser, otherwise just set it as an empty
                 # list.
                 aliases = self.alias_mapping.get(self.name.replace("_", "-"), [])
+                instructions = self.cmd_instructions["instructions"][self.combined_name]
                 # Attempt to create a sepate sub-parser for the specific command
                 # class being initialized so we can separate the commands arguments
                 # in a tree-like structure
                 self.parser = parent.subparsers.add_parser(
                     self.name,
-                    description=self.cmd_instructions["instructions"][
-                        self.combined_name
-                    ]["help_str"],
-                    help=self.cmd_instructions["instructions"][self.combined_name][
-                        "help_str"
-                    ],
-                    usage=self.cmd_instructions["instructions"][self.combined_name][
-                        "usage_str"
-                    ],
+                    description=instructions["help_str"],
+                    help=instructions["help_str"],
+                    usage=instructions["usage_str"],
                     parents=self.parent_parsers,
                     conflict_handler="resolve",
                     aliases=aliases,
@@ -387,23 +467,12 @@ class GeoipsExecutableCommand(GeoipsCommand):
         plugin_entry: dict
             - The dictionary of info for a certain plugin in the plugin registry.
         """
-        yaml_text = yaml.dump(dict_entry, default_flow_style=False)
-        print()
-        for line in yaml_text.split("\n"):
-            # Color the keys in cyan and values in yellow
-            if ":" in line:
-                key, value = line.split(":", 1)
-                key = key.title().replace("_", " ")
-                if key in ["Package", "Geoips Package"]:
-                    key = "GeoIPS Package"
-                elif key == "Relpath":
-                    key = "Relative Path"
-                formatted_line = Fore.CYAN + key + ":" + Style.RESET_ALL
-                formatted_line += Fore.YELLOW + value + Style.RESET_ALL
-                print(formatted_line)
-            else:
-                formatted_line = "\t" + Fore.YELLOW + line + Style.RESET_ALL
-                print(formatted_line)
+        from colorama import Fore, Style
+
+        colors = (Fore.CYAN, Fore.YELLOW, Style.RESET_ALL)
+        # Join every line and output them with a single write, rather than one print
+        # call per line of the entry.
+        print("\n" + "\n".join(_emit_colored(dict_entry, colors)))
 
     def _get_registry_by_interface_and_package(self, interface, package_name):
         """Retrieve the correct plugin registry given interface and package name.
@@ -449,9 +518,7 @@ class GeoipsExecutableCommand(GeoipsCommand):
             else:
                 interface_registry = None
         else:
-            interface_registry = json.load(
-                open(resources.files(package_name) / "registered_plugins.json", "r")
-            )
+            interface_registry = _load_package_registry(package_name)
             if interface.name in interface_registry[interface.interface_type]:
                 interface_registry = interface_registry[interface.interface_type][
                     interface.name
@@ -516,6 +583,8 @@ class GeoipsExecutableCommand(GeoipsCommand):
         args: argparse Argument Namespace
             - The arguments provided to a certain list command
         """
+        from tabulate import tabulate
+
         default_headers = {
             "package": "GeoIPS Package",
             "interface": "Interface Name",
@@ -565,8 +634,7 @@ class GeoipsExecutableCommand(GeoipsCommand):
         """
         table_data = []
         if interface.name == "products":
-            for plugin_key in sorted(interface_registry.keys()):
-                product_dict = interface_registry[plugin_key]
+            for _source_name, product_dict in sorted(interface_registry.items()):
                 table_data += self._get_entry(product_dict, headers)
         else:
             table_data += self._get_entry(interface_registry, headers)
@@ -598,23 +666,20 @@ class GeoipsExecutableCommand(GeoipsCommand):
               order of headers.keys()
         """
         table_data = []
-        for plugin_key in list(plugin_dict.keys()):
+        header_keys = list(headers.keys())
+        for plugin_key, plugin_info in plugin_dict.items():
+            # Look up each plugin's entry once, rather than once per header
+            is_product = plugin_info["interface"] == "products"
             plugin_entry = []
-            for header in list(headers.keys()):
-                if (
-                    header == "source_names"
-                    and plugin_dict[plugin_key]["interface"] != "products"
-                ):
+            for header in header_keys:
+                if header == "source_names" and not is_product:
                     plugin_entry.append("N/A")
-                elif (
-                    header == "family"
-                    and plugin_dict[plugin_key]["interface"] == "products"
-                ):
+                elif header == "family" and is_product:
                     plugin_entry.append("N/A")
                 elif header == "plugin_name":
                     plugin_entry.append(plugin_key)
                 else:
-                    plugin_entry.append(plugin_dict[plugin_key][header])
+                    plugin_entry.append(plugin_info[header])
             table_data.append(plugin_entry)
         return table_data
 
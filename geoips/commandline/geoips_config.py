@@ -6,6 +6,7 @@
 Various configuration-based commands for setting up your geoips environment.
 """
 
+from functools import cached_property
 from numpy import any
 from os import listdir, environ
 from os.path import abspath, join
@@ -26,12 +27,10 @@ class GeoipsConfigInstall(GeoipsExecutableCommand):
     name = "install"
     command_classes = []
 
-    @property
+    @cached_property
     def geoips_testdata_dir(self):
         """String path to GEOIPS_TESTDATA_DIR."""
-        if not hasattr(self, "_geoips_testdata_dir"):
-            self._geoips_testdata_dir = environ["GEOIPS_TESTDATA_DIR"]
-        return self._geoips_testdata_dir
+        return environ["GEOIPS_TESTDATA_DIR"]
 
     def add_arguments(self):
         """Add arguments to the config-subparser for the Config Command."""
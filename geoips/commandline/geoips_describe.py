@@ -18,6 +18,9 @@ from geoips.commandline.geoips_command import (
 from geoips.create_plugin_registries import format_docstring
 from geoips import interfaces
 
+# Resolve the yaml loader once at import, preferring the libyaml-backed loader.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class GeoipsDescribeArtifact(GeoipsExecutableCommand):
     """Command which returns information describing a GeoIPS artifact.
@@ -221,7 +224,8 @@ class GeoipsDescribeArtifact(GeoipsExecutableCommand):
                 resources.files("geoips")
                 / f"schema/{interface_name}/{family_name}.yaml"
             )
-            family_args_or_schema = yaml.safe_load(open(family_path, "r"))
+            with open(family_path, "r") as schema_file:
+                family_args_or_schema = yaml.load(schema_file, Loader=SafeLoader)
             if "description" in list(family_args_or_schema.keys()):
                 family_args_or_schema["description"] = format_docstring(
                     family_args_or_schema["description"],
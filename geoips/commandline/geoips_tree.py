@@ -7,6 +7,8 @@ Single 'geoips tree' command which will display GeoIPS CLI commands up to a --ma
 value.
 """
 
+from functools import cached_property
+
 from colorama import Fore, Style
 
 from geoips.commandline.geoips_command import GeoipsExecutableCommand
@@ -29,7 +31,7 @@ class GeoipsTree(GeoipsExecutableCommand):
     describe_sectors_outputted = False
     list_sectors_outputted = False
 
-    @property
+    @cached_property
     def cmd_aliases(self):
         """List of aliases we don't want to include in the tree.
 
@@ -37,44 +39,35 @@ class GeoipsTree(GeoipsExecutableCommand):
         So for 'list' (or 'ls'), there will be two 'geoips list' entries which we don't
         want.
         """
-        if not hasattr(self, "_cmd_aliases"):
-            self._cmd_aliases = []
-            for cmd_name in self.alias_mapping:
-                for alias in self.alias_mapping[cmd_name]:
-                    # Aliases below are names of actual commands and we need to deal
-                    # with this using conditionals in 'print_tree'
-                    if alias not in ["sector"]:
-                        self._cmd_aliases.append(alias)
-        return self._cmd_aliases
-
-    @property
+        cmd_aliases = []
+        for cmd_name in self.alias_mapping:
+            for alias in self.alias_mapping[cmd_name]:
+                # Aliases below are names of actual commands and we need to deal
+                # with this using conditionals in 'print_tree'
+                if alias not in ["sector"]:
+                    cmd_aliases.append(alias)
+        return cmd_aliases
+
+    @cached_property
     def top_level_parser(self):
         """The parser associated with the top level 'geoips' command."""
-        if not hasattr(self, "_top_level_parser"):
-            # Get 'geoips' parser
-            self._top_level_parser = self.parent.parser
-        return self._top_level_parser
+        # Get 'geoips' parser
+        return self.parent.parser
 
-    @property
+    @cached_property
     def level_to_color(self):
         """A color-mapping dictionary based on the depth of the command tree."""
-        if not hasattr(self, "_level_to_color"):
-            self._level_to_color = {
-                0: Fore.RED,
-                1: Fore.YELLOW,
-                2: Fore.BLUE,
-                3: Fore.MAGENTA,
-            }
-        return self._level_to_color
-
-    @property
+        return {
+            0: Fore.RED,
+            1: Fore.YELLOW,
+            2: Fore.BLUE,
+            3: Fore.MAGENTA,
+        }
+
+    @cached_property
     def cmd_line_url(self):
         """The url to the GeoIPS documentation for the GeoIPS CLI."""
-        if not hasattr(self, "_cmd_line_url"):
-            self._cmd_line_url = (
-                f"{gpaths['GEOIPS_DOCS_URL']}{r'userguide/command_line.html'}"
-            )
-        return self._cmd_line_url
+        return f"{gpaths['GEOIPS_DOCS_URL']}{r'userguide/command_line.html'}"
 
     def link(self, uri, label=None):
         """Hyperlink the provided uri alongside 'label' if applicable.
@@ -16,6 +16,9 @@ import yaml
 from geoips.commandline.geoips_command import GeoipsExecutableCommand
 from geoips import interfaces
 
+# Resolve the yaml loader once at import, preferring the libyaml-backed loader.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class GeoipsValidate(GeoipsExecutableCommand):
     """Validate Command for validating package plugins."""
@@ -79,7 +82,8 @@ class GeoipsValidate(GeoipsExecutableCommand):
         elif fpath.suffix == ".yaml":
             # yaml-based plugin
             interface_type = "yaml_based"
-            plugin = yaml.safe_load(open(fpath, "r"))
+            with open(fpath, "r") as plugin_file:
+                plugin = yaml.load(plugin_file, Loader=SafeLoader)
         else:
             self.parser.error(
                 "Only '.py' and '.yaml' files are accepted at this time. Try again."
@@ -153,9 +153,11 @@ class LogLevelAdder:
 
         if level_num not in self._logForLevel_funcs:
 
-            def logForLevel(self, message, *args, **kwargs):
-                if self.isEnabledFor(level_num):
-                    self._log(level_num, message, args, **kwargs)
+            # level_num is bound as a keyword-only default so each call reads it as a
+            # local variable rather than through the enclosing closure.
+            def logForLevel(self, message, *args, _level_num=level_num, **kwargs):
+                if self.isEnabledFor(_level_num):
+                    self._log(_level_num, message, args, **kwargs)
 
             self._logForLevel_funcs[level_num] = logForLevel
         return self._logForLevel_funcs[level_num]
@@ -166,8 +168,8 @@ class LogLevelAdder:
 
         if level_num not in self._logToRoot_funcs:
 
-            def logToRoot(message, *args, **kwargs):
-                logging.log(level_num, message, *args, **kwargs)
+            def logToRoot(message, *args, _level_num=level_num, **kwargs):
+                logging.log(_level_num, message, *args, **kwargs)
 
             self._logToRoot_funcs[level_num] = logToRoot
         return self._logToRoot_funcs[level_num]
@@ -7,6 +7,8 @@ MUST call with --procflow.
 """
 
 from datetime import datetime
+import logging
+
 from geoips.commandline.log_setup import setup_logging
 from geoips.commandline.args import get_command_line_args
 from geoips.interfaces import procflows
@@ -38,37 +40,36 @@ def main(get_command_line_args_func=None, ARGS=None):
             description="Run data file processing",
         )
 
-    COMMAND_LINE_ARGS = ARGS.__dict__
+    # The procflows expect a dictionary of arguments, so build it once here.
+    COMMAND_LINE_ARGS = vars(ARGS)
+    procflow_name = ARGS.procflow
+    filenames = ARGS.filenames
     if COMMAND_LINE_ARGS.get("logging_level"):
         LOG = setup_logging(logging_level=COMMAND_LINE_ARGS["logging_level"])
     else:
         LOG = setup_logging()
     LOG.info("RETRIEVED COMMAND LINE ARGUMENTS")
-    LOG.interactive("\n\n\nStarting %s procflow...\n\n", COMMAND_LINE_ARGS["procflow"])
+    LOG.interactive("\n\n\nStarting %s procflow...\n\n", procflow_name)
     import sys
 
-    LOG.info(
-        "COMMANDLINE CALL: \n    %s",
-        "\n        ".join([currarg + " \\" for currarg in sys.argv]),
-    )
+    if LOG.isEnabledFor(logging.INFO):
+        LOG.info(
+            "COMMANDLINE CALL: \n    %s",
+            "\n        ".join([currarg + " \\" for currarg in sys.argv]),
+        )
 
     # LOG.info(COMMAND_LINE_ARGS)
     LOG.info("GETTING PROCFLOW MODULE")
-    PROCFLOW = procflows.get_plugin(COMMAND_LINE_ARGS["procflow"])
+    PROCFLOW = procflows.get_plugin(procflow_name)
 
-    LOG.info(f"CALLING PROCFLOW MODULE: {PROCFLOW.name}")
+    LOG.info("CALLING PROCFLOW MODULE: %s", PROCFLOW.name)
     if PROCFLOW:
-        LOG.info(COMMAND_LINE_ARGS["filenames"])
-        LOG.interactive(
-            "\n\n\nRunning on filenames: %s\n\n", COMMAND_LINE_ARGS["filenames"]
-        )
+        LOG.info(filenames)
+        LOG.interactive("\n\n\nRunning on filenames: %s\n\n", filenames)
         LOG.info(COMMAND_LINE_ARGS)
         LOG.info(PROCFLOW)
-        RETVAL = PROCFLOW(COMMAND_LINE_ARGS["filenames"], COMMAND_LINE_ARGS)
-        LOG.interactive(
-            "Completed geoips PROCFLOW %s processing, done!",
-            COMMAND_LINE_ARGS["procflow"],
-        )
+        RETVAL = PROCFLOW(filenames, COMMAND_LINE_ARGS)
+        LOG.interactive("Completed geoips PROCFLOW %s processing, done!", procflow_name)
         LOG.info("Starting time: %s", DATETIMES["start"])
         LOG.info("Ending time: %s", datetime.utcnow())
         LOG.interactive("Total time: %s", datetime.utcnow() - DATETIMES["start"])
@@ -95,11 +96,7 @@ def main(get_command_line_args_func=None, ARGS=None):
         sys.exit(RETVAL)
 
     else:
-        raise IOError(
-            "FAILED no geoips*/{0}.py with def {0}".format(
-                COMMAND_LINE_ARGS["procflow"]
-            )
-        )
+        raise IOError("FAILED no geoips*/{0}.py with def {0}".format(procflow_name))
 
 
 if __name__ == "__main__":
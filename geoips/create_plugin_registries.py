@@ -12,9 +12,10 @@ EVERY currently installed plugin package. A separate registered_plugins.json is
 created at the top level package directory for each plugin package.
 """
 
+import ast
 import warnings
 import yaml
-from importlib import metadata, resources, util
+from importlib import resources, util
 from inspect import signature
 from os.path import (
     basename,
@@ -25,19 +26,28 @@ from os.path import (
     join as osjoin,
     relpath as osrelpath,
 )
-from os import remove
+from os import remove, scandir, stat
 import re
 import sys
 import logging
 from geoips.commandline.log_setup import setup_logging
 import geoips.interfaces
 from geoips.errors import PluginRegistryError
+from geoips.geoips_utils import get_entry_point_group
+from geoips._version import __version__
 import json
 from argparse import ArgumentParser
 
 
 LOG = logging.getLogger(__name__)
 
+# Use the libyaml C implementations when available, they are several times faster than
+# the pure python loader / dumper when reading every yaml plugin.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+# Directories within a package's plugins directory which never contain plugins.
+SKIPPED_PLUGIN_DIRS = ("__pycache__", ".git")
+
 
 def format_docstring(docstring, use_regex=True):
     """Format the provided docstring placement in the plugin registry.
@@ -94,15 +104,19 @@ def remove_registries(plugin_packages):
         "Once fixed, please run 'create_plugin_registries' to set up GeoIPS "
         "appropriately\n\n\n"
     )
-    # Remove registered_plugins.yaml and registered_plugins.json if they exist
-    # for each plugin package.
+    # Remove registered_plugins.yaml, registered_plugins.json, the pickled copy of
+    # the json registry, and the module plugin cache if they exist for each plugin
+    # package.
     for pkg in plugin_packages:
-        yaml_plug_path = str(resources.files(pkg.value) / "registered_plugins.yaml")
-        json_plug_path = str(resources.files(pkg.value) / "registered_plugins.json")
-        if exists(yaml_plug_path):
-            remove(yaml_plug_path)
-        if exists(json_plug_path):
-            remove(json_plug_path)
+        for reg_name in [
+            "registered_plugins.yaml",
+            "registered_plugins.json",
+            "registered_plugins.pkl",
+            "plugin_cache.json",
+        ]:
+            reg_path = str(resources.files(pkg.value) / reg_name)
+            if exists(reg_path):
+                remove(reg_path)
 
 
 def registry_sanity_check(plugin_packages, save_type):
@@ -135,21 +149,26 @@ def registry_sanity_check(plugin_packages, save_type):
         identifying and resolving errors throughout all plugin packages.
     """
     error_message = ""
-    # comp_pkg is the package being compared against. This package is compared
-    # against every other available GeoIPS package that is installed.
-    for comp_idx, comp_pkg in enumerate(plugin_packages):
+    # Read each package's registry once up front, rather than re-reading every other
+    # package's registry for each package it is compared against.
+    registries = []
+    for pkg in plugin_packages:
         # yaml output is used primarily for testing purposes (since it is more human
         # readable than json), and json output is used for processing. Ensure we
         # can load either option.
         if save_type == "yaml":
-            comp_registry = yaml.safe_load(
-                open(resources.files(comp_pkg.value) / "registered_plugins.yaml")
-            )
+            reg_path = resources.files(pkg.value) / "registered_plugins.yaml"
+            with open(reg_path, "r") as reg_file:
+                registries.append(yaml.load(reg_file, Loader=SafeLoader))
         else:
             # json.load is much faster than yaml.safe_load
-            comp_registry = json.load(
-                open(resources.files(comp_pkg.value) / "registered_plugins.json", "r")
-            )
+            reg_path = resources.files(pkg.value) / "registered_plugins.json"
+            with open(reg_path, "r") as reg_file:
+                registries.append(json.load(reg_file))
+    # comp_pkg is the package being compared against. This package is compared
+    # against every other available GeoIPS package that is installed.
+    for comp_idx, comp_pkg in enumerate(plugin_packages):
+        comp_registry = registries[comp_idx]
         for pkg_idx, pkg in enumerate(plugin_packages):
             # pkg is the package being compared against comp_pkg. For example, if
             # comp_pkg was 'geoips', then it would compare against recenter_tc,
@@ -162,14 +181,7 @@ def registry_sanity_check(plugin_packages, save_type):
                 continue
             # Track sets of plugins by plugin type
             # (schemas, yaml_based, and module_based)
-            if save_type == "yaml":
-                pkg_registry = yaml.safe_load(
-                    open(resources.files(pkg.value) / "registered_plugins.yaml")
-                )
-            else:
-                pkg_registry = json.load(
-                    open(resources.files(pkg.value) / "registered_plugins.json", "r")
-                )
+            pkg_registry = registries[pkg_idx]
             for plugin_type in list(pkg_registry.keys()):
                 # check the pkg's registry for both yaml-based and module-based plugins
                 for interface in comp_registry[plugin_type]:
@@ -292,6 +304,58 @@ def check_plugin_exists(package, plugins, interface_name, plugin_name, relpath):
     return ""
 
 
+def load_plugin_cache(pkg_dir):
+    """Load the cached module plugin registry entries for a plugin package.
+
+    Building the registry entry of a module plugin requires parsing its source, or
+    importing it if its attributes can't be read statically. Entries built from
+    the module's literals are cached alongside the stat information of its file, so
+    unchanged modules don't need to be parsed again the next time the registries are
+    created. The entries of modules which had to be imported are never cached, since
+    they can depend on the environment they were imported in.
+
+    Parameters
+    ----------
+    pkg_dir: str
+        Path to the plugin package containing the cache.
+
+    Returns
+    -------
+    file_cache: dict
+        Dictionary of cached entries keyed by the relpath of each module. Empty if the
+        cache doesn't exist, is unreadable, or was written by a different version of
+        GeoIPS.
+    """
+    cache_path = osjoin(pkg_dir, "plugin_cache.json")
+    try:
+        with open(cache_path, "r") as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("geoips_version") != __version__:
+        return {}
+    return cache.get("files", {})
+
+
+def write_plugin_cache(pkg_dir, file_cache):
+    """Write the cached module plugin registry entries for a plugin package.
+
+    Parameters
+    ----------
+    pkg_dir: str
+        Path in which to write plugin_cache.json
+    file_cache: dict
+        Dictionary of cached entries keyed by the relpath of each module.
+    """
+    cache_path = osjoin(pkg_dir, "plugin_cache.json")
+    try:
+        with open(cache_path, "w") as cache_file:
+            json.dump({"geoips_version": __version__, "files": file_cache}, cache_file)
+    except OSError as resp:
+        # The cache is only an optimization, never fail registry creation over it.
+        LOG.debug(f"Unable to write plugin cache {cache_path}: {resp}")
+
+
 def write_registered_plugins(pkg_dir, plugins, save_type):
     """Write dictionary of all plugins available from installed GeoIPS packages.
 
@@ -312,7 +376,16 @@ def write_registered_plugins(pkg_dir, plugins, save_type):
         reg_plug_abspath = osjoin(pkg_dir, "registered_plugins.yaml")
         with open(reg_plug_abspath, "w") as plugin_registry:
             LOG.interactive("Writing %s", reg_plug_abspath)
-            yaml.safe_dump(plugins, plugin_registry, default_flow_style=False)
+            # Keep the order plugins were found in (as the json registry does) rather
+            # than sorting every mapping, and don't wrap long docstrings.
+            yaml.dump(
+                plugins,
+                plugin_registry,
+                Dumper=SafeDumper,
+                default_flow_style=False,
+                sort_keys=False,
+                width=10**9,
+            )
     else:
         reg_plug_abspath = osjoin(pkg_dir, "registered_plugins.json")
         with open(reg_plug_abspath, "w") as plugin_registry:
@@ -320,7 +393,9 @@ def write_registered_plugins(pkg_dir, plugins, save_type):
             json.dump(plugins, plugin_registry, indent=4)
 
 
-def create_plugin_registries(plugin_packages, save_type):
+def create_plugin_registries(
+    plugin_packages, save_type, use_cache=True, import_modules=False
+):
     """Generate all plugin paths associated with every installed GeoIPS packages.
 
     These paths include schema plugins, module_based plugins
@@ -336,6 +411,13 @@ def create_plugin_registries(plugin_packages, save_type):
         [EntryPoint(name='geoips', value='geoips', group='geoips.plugin_packages'), ...]
     save_type: str
         The file format to save to [json, yaml]
+    use_cache: bool, optional (default=True)
+        Whether or not to reuse the cached registry entries of module plugins whose
+        files have not changed since the registries were last created.
+    import_modules: bool, optional (default=False)
+        Whether or not to import every module plugin rather than reading its
+        attributes from its source where possible. Module plugins which fail to import
+        (ie. due to a broken top level import) are only reported when this is True.
     """
     # It appears when there is *.egg-info directory, it picks that package up
     # twice in the list.  If the same package path exists twice, only keep one
@@ -380,11 +462,12 @@ def create_plugin_registries(plugin_packages, save_type):
         # not hard coded here in the create_plugin_registries code.
         pkg_plugin_path = resources.files(package) / "plugins"
         pkg_dir = str(resources.files(package))
-        # Grab all YAML, Python, and txt files within the plugins directory.
+        # Grab all YAML, Python, and txt files within the plugins directory, with a
+        # single walk of the directory tree.
         # YAML schema files may be supported in the future.
-        yaml_files = pkg_plugin_path.rglob("*.yaml")
-        python_files = pkg_plugin_path.rglob("*.py")
-        text_files = pkg_plugin_path.rglob("*.txt")
+        plugin_files = {".yaml": [], ".py": [], ".txt": []}
+        for suffix, filepath in _walk_plugins(str(pkg_plugin_path)):
+            plugin_files[suffix].append(filepath)
         # Potentially support installing schema into the geoips name space
         # using entry points as well.  Currently unsupported, but this would
         # allow specifying different YAML plugin schema in different
@@ -396,10 +479,10 @@ def create_plugin_registries(plugin_packages, save_type):
         # type (ie, yaml based, text based, and module based plugins, and
         # in the future potentially schema)
         plugin_paths = {
-            "yamls": sorted(yaml_files),
-            "text": text_files,
+            "yamls": sorted(plugin_files[".yaml"]),
+            "text": plugin_files[".txt"],
             # "schemas": schema_yamls,
-            "pyfiles": python_files,
+            "pyfiles": plugin_files[".py"],
         }
         # `plugins` is passed by reference and populated with all YAML, text, and
         # python plugins found within the current plugin package `package`.
@@ -408,7 +491,19 @@ def create_plugin_registries(plugin_packages, save_type):
         # If any errors are found, append the error message string to the current
         # error_message.  Do not raise an exception until all plugins have been
         # read in, so we can collect and report on all errors at once.
-        error_message += parse_plugin_paths(plugin_paths, package, pkg_dir, plugins)
+        file_cache = load_plugin_cache(pkg_dir) if use_cache else {}
+        error_message += parse_plugin_paths(
+            plugin_paths, package, pkg_dir, plugins, file_cache, import_modules
+        )
+        # Only retain cache entries for modules which still exist.
+        write_plugin_cache(
+            pkg_dir,
+            {
+                relpath: entry
+                for relpath, entry in file_cache.items()
+                if exists(osjoin(pkg_dir, relpath))
+            },
+        )
         LOG.debug("Available Plugin Types:\n" + str(plugins.keys()))
         LOG.debug(
             "Available YAML Plugin Interfaces:\n" + str(plugins["yaml_based"].keys())
@@ -425,7 +520,7 @@ def create_plugin_registries(plugin_packages, save_type):
         # Remove all registries to prevent running geoips with an incomplete
         # or corrupt set of plugins.  Force user to resolve errors before
         # proceeding.
-        remove_registries(metadata.entry_points(group="geoips.plugin_packages"))
+        remove_registries(get_entry_point_group("geoips.plugin_packages"))
         # Now raise the error, including the error message with output
         # from every failed plugin/file during the attempted registry process.
         raise PluginRegistryError(error_message)
@@ -435,7 +530,49 @@ def create_plugin_registries(plugin_packages, save_type):
     registry_sanity_check(unique_package_entry_points, save_type)
 
 
-def parse_plugin_paths(plugin_paths, package, package_dir, plugins):
+def _walk_plugins(root):
+    """Yield the plugin files found anywhere within the root directory.
+
+    The directory tree is walked once with os.scandir, rather than once per file type,
+    and directories which never contain plugins (ie. __pycache__) are skipped, as are
+    package __init__.py files.
+
+    Parameters
+    ----------
+    root: str
+        The path to the directory containing plugins.
+
+    Yields
+    ------
+    suffix: str
+        The file's suffix, one of ".yaml", ".py" or ".txt".
+    filepath: str
+        The full path to the file.
+    """
+    try:
+        entries = list(scandir(root))
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    subdirs = []
+    # Yield each directory's files before descending into its subdirectories, which
+    # matches the order the files were previously found in with Path.rglob.
+    for entry in entries:
+        if entry.is_dir():
+            if entry.name not in SKIPPED_PLUGIN_DIRS:
+                subdirs.append(entry.path)
+            continue
+        if entry.name == "__init__.py":
+            continue
+        suffix = splitext(entry.name)[1]
+        if suffix in (".yaml", ".py", ".txt"):
+            yield suffix, entry.path
+    for subdir in subdirs:
+        yield from _walk_plugins(subdir)
+
+
+def parse_plugin_paths(
+    plugin_paths, package, package_dir, plugins, file_cache=None, import_modules=False
+):
     """Parse the plugin_paths provided from the current installed GeoIPS package.
 
     Then, add them to the plugins dictionary based on the path of the plugin.
@@ -452,6 +589,11 @@ def parse_plugin_paths(plugin_paths, package, package_dir, plugins):
         The path to the current GeoIPS package (for determining relative paths)
     plugins: dict
         A dictionary object of all installed GeoIPS package plugins
+    file_cache: dict, optional
+        Cached module plugin registry entries, see load_plugin_cache. Updated in place
+        with the entries of any module plugins which had to be rebuilt.
+    import_modules: bool, optional (default=False)
+        Whether or not to import every module plugin, see add_module_plugin.
 
     Returns
     -------
@@ -464,13 +606,19 @@ def parse_plugin_paths(plugin_paths, package, package_dir, plugins):
         resolving errors.
     """
     error_message = ""
+    # Plugin paths are found within package_dir, so their relative paths are simply
+    # what follows this prefix. Only fall back to normalizing with relpath otherwise.
+    package_prefix = osjoin(package_dir, "")
     # Loop through each plugin type, ie, text, yaml, module, and later schema.
     for plugin_type in plugin_paths:
         # Loop through each file of the current plugin type.
         for filepath in plugin_paths[plugin_type]:
             filepath = str(filepath)
             # Path relative to the package directory
-            relpath = osrelpath(filepath, start=package_dir)
+            if filepath.startswith(package_prefix):
+                relpath = filepath[len(package_prefix) :]
+            else:
+                relpath = osrelpath(filepath, start=package_dir)
             # plugins is passed by reference, so any new plugins found
             # are added to the plugins dictionary and retained throughout.
             if plugin_type == "yamls":  # yaml based plugins
@@ -492,7 +640,11 @@ def parse_plugin_paths(plugin_paths, package, package_dir, plugins):
             #     )
             else:  # module based plugins
                 error_message += add_module_plugin(
-                    package, relpath, plugins["module_based"]
+                    package,
+                    relpath,
+                    plugins["module_based"],
+                    file_cache,
+                    import_modules,
                 )
     # Ensure we return a string error_message with ALL errors appended.
     # This will be raised at the end if error_message has any contents.
@@ -523,7 +675,8 @@ def add_yaml_plugin(filepath, relpath, package, plugins):
         reporting them all at once, to facilitate rapidly identifying and
         resolving errors.
     """
-    plugin = yaml.safe_load(open(filepath, mode="r"))
+    with open(filepath, mode="r") as plugin_file:
+        plugin = yaml.load(plugin_file, Loader=SafeLoader)
     plugin["relpath"] = relpath
     plugin["package"] = package
 
@@ -536,8 +689,7 @@ def add_yaml_plugin(filepath, relpath, package, plugins):
         )
     interface_module = getattr(geoips.interfaces, f"{interface_name}")
 
-    if interface_name not in plugins.keys():
-        plugins[interface_name] = {}
+    interface_plugins = plugins.setdefault(interface_name, {})
 
     error_message = ""
     # If the current family is "list", make sure we loop through the list,
@@ -568,8 +720,7 @@ def add_yaml_plugin(filepath, relpath, package, plugins):
             for subplg_name in subplg_names:
                 subplg_source = str(subplg_name[0])
                 subplg_product = str(subplg_name[1])
-                if subplg_source not in plugins[interface_name]:
-                    plugins[interface_name][subplg_source] = {}
+                source_plugins = interface_plugins.setdefault(subplg_source, {})
                 # since we are dealing with sub-plugins of a product plugin,
                 # include a couple other pieces of information, such as
                 # product_defaults and source_names.
@@ -628,7 +779,7 @@ def add_yaml_plugin(filepath, relpath, package, plugins):
                 #             docstring = plugins["product_defaults"][pd]["docstring"]
                 #         if not family:
                 #             family = plugins["product_defaults"][pd]["family"]
-                plugins[interface_name][subplg_source][subplg_product] = {
+                source_plugins[subplg_product] = {
                     "docstring": format_docstring(docstring),
                     "family": family,
                     "interface": interface_module.name,
@@ -648,7 +799,7 @@ def add_yaml_plugin(filepath, relpath, package, plugins):
         # Since this is not a product plugin, we can ensure that these top-level
         # attributes should exist. Don't include product_defaults or source_names in
         # this info, because it doesn't apply to this type of plugin.
-        plugins[interface_name][plugin["name"]] = {
+        interface_plugins[plugin["name"]] = {
             "docstring": format_docstring(plugin["docstring"]),
             "family": plugin["family"],
             "interface": plugin["interface"],
@@ -693,9 +844,10 @@ def add_text_plugin(package, relpath, plugins):
     # For now, use the last directory name as the interface name.
     interface_name = split(dirname(relpath))[-1]
     error_message = ""
-    if interface_name not in plugins:
-        plugins[interface_name] = {}
-    plugins[interface_name][text_name] = {"package": package, "relpath": relpath}
+    plugins.setdefault(interface_name, {})[text_name] = {
+        "package": package,
+        "relpath": relpath,
+    }
     # For now we have no error messages for text plugins, it will always be
     # an empty string.  But return it anyway.
     return error_message
@@ -734,7 +886,7 @@ def add_text_plugin(package, relpath, plugins):
 #     # )
 
 
-def add_module_plugin(package, relpath, plugins):
+def add_module_plugin(package, relpath, plugins, file_cache=None, import_modules=False):
     """Add the module plugin associated with the filepaths and package to plugins.
 
     Parameters
@@ -742,9 +894,20 @@ def add_module_plugin(package, relpath, plugins):
     package: str
         The current GeoIPS package being parsed
     relpath: str
-        The relpath path to the module plugin
+        The relpath path to the module plugin (never a package __init__.py, those are
+        skipped by _walk_plugins)
     plugins: dict
         A dictionary object of all installed GeoIPS package plugins
+    file_cache: dict, optional
+        Cached module plugin registry entries, see load_plugin_cache. If the module
+        is unchanged since it was cached, the cached entry is used rather than
+        rebuilding it. Otherwise the module's new entry is added to file_cache, unless
+        the module had to be imported to build it.
+    import_modules: bool, optional (default=False)
+        Whether or not to import the module even if its attributes can be read from
+        its source. Reading the source does not execute the module, so errors raised
+        when importing it (ie. a broken top level import) are only reported when this
+        is True. The plugin cache is neither used nor updated for imported modules.
 
     Returns
     -------
@@ -757,14 +920,339 @@ def add_module_plugin(package, relpath, plugins):
         resolving errors.
     """
     error_message = ""
-    if "__init__.py" in relpath:
-        return error_message
     module_name = splitext(basename(relpath))[0]
+    abspath = resources.files(package) / relpath
+    # Modules are considered unchanged if both their modification time and size match
+    # those recorded when the module was cached.
+    file_stat = stat(abspath)
+    file_key = [file_stat.st_mtime_ns, file_stat.st_size]
+    cached = file_cache.get(relpath) if file_cache is not None else None
+    if not import_modules and cached is not None and cached["key"] == file_key:
+        interface_name = cached["interface"]
+        if interface_name:
+            name = cached["name"]
+            plugin_entry = cached["entry"]
+    else:
+        # Errors are never cached, failing modules are imported every time so that
+        # their errors are reported until they are fixed.
+        parsed = None
+        if not import_modules:
+            parsed = _parse_module_plugin(package, relpath, abspath)
+        # Only entries built from the module's literals are cached. The entries of
+        # imported modules can depend on the environment (ie. default arguments built
+        # from GEOIPS_OUTDIRS), so those modules are imported every time.
+        cacheable = parsed is not None
+        if parsed is None:
+            # The module's attributes couldn't be determined statically, import it.
+            parsed = _import_module_plugin(package, relpath, abspath, module_name)
+        error_message, interface_name, name, plugin_entry = parsed
+        if error_message:
+            return error_message
+        if file_cache is not None and not import_modules:
+            if cacheable:
+                file_cache[relpath] = {
+                    "key": file_key,
+                    "interface": interface_name,
+                    "name": name,
+                    "entry": plugin_entry,
+                }
+            else:
+                file_cache.pop(relpath, None)
+    # If interface is None, then legitimately skip the module.
+    if not interface_name:
+        LOG.interactive(
+            f"Skipping module '{module_name}' from '{package}', "
+            "interface_name is 'None'"
+        )
+        return error_message
+    # If the current interface_name is not in the plugins dictionary yet, add it
+    # as an empty dictionary.
+    interface_plugins = plugins.setdefault(interface_name, {})
+    # Check_plugin_exists will return a text error message if there are any errors
+    # rather than raising an exception.  This allows collecting all errors as
+    # we go, and reporting once at the end with an error message including ALL
+    # errors found across all plugins in all plugin packages.  Append the new
+    # error message to the error messages that have already been collected.
+    error_message += check_plugin_exists(
+        package, plugins, interface_name, name, relpath
+    )
+    interface_plugins[name] = plugin_entry
+    # Return the final error message - an exception will be raised at the very
+    # end after collecting and reporting on all errors if there were any errors
+    # during plugin registry creation.
+    return error_message
+
+
+def _module_plugin_entry(
+    package,
+    relpath,
+    interface_name,
+    name,
+    family,
+    docstring,
+    call_signature,
+    has_source_names,
+    source_names,
+):
+    """Build the plugin registry entry for a module plugin.
+
+    Parameters
+    ----------
+    package: str
+        The current GeoIPS package being parsed
+    relpath: str
+        The relpath path to the module plugin
+    interface_name, name, family: str
+        The interface, name, and family of the plugin
+    docstring: str
+        The module's docstring
+    call_signature: str
+        The string representation of the signature of the plugin's 'call' function
+    has_source_names: bool
+        Whether or not the module defines a 'source_names' attribute
+    source_names: list or None
+        The module's 'source_names' attribute, if defined
+
+    Returns
+    -------
+    plugin_entry: dict
+        The plugin registry entry for this plugin.
+    """
+    # Add info shown below obtained from the module plugin. Every module plugin
+    # is required to have these entries in the registry to be considered a valid
+    # plugin.
+    plugin_entry = {
+        "docstring": format_docstring(docstring),
+        "family": family,
+        "interface": interface_name,
+        "package": package,
+        "plugin_type": "module_based",
+        "signature": call_signature,
+        "relpath": relpath,
+    }
+    if interface_name == "readers":
+        if has_source_names:
+            plugin_entry["source_names"] = source_names
+        else:
+            warnings.warn(
+                (
+                    f"Plugin package '{package}'s reader"
+                    f" plugin '{name}' is using a deprecated source_names "
+                    "implementation. Please add a module-level 'source_names' "
+                    "attribute to this plugin and re-run "
+                    "'create_plugin_registries'. This will be fully deprecated "
+                    "when GeoIPS v2.0.0 is released."
+                ),
+                DeprecationWarning,
+                stacklevel=3,
+            )
+            plugin_entry["source_names"] = ["Unspecified"]
+    return plugin_entry
+
+
+# Placeholder for module level assignments whose value is not a literal.
+_NOT_LITERAL = object()
+
+
+def _parse_module_plugin(package, relpath, abspath):
+    """Build a module plugin's registry entry from its source, without importing it.
+
+    Importing a plugin executes it, along with everything it imports (numpy, xarray,
+    matplotlib, ...), which is the most expensive part of registering a module plugin.
+    Every attribute needed for the registry is almost always a literal assigned at the
+    top level of the module, so read them from the module's syntax tree instead.
+
+    If any of the required attributes can't be determined unambiguously this way (ie.
+    an attribute is computed, imported, conditionally assigned, or 'call' is decorated
+    or annotated), None is returned and the module should be imported instead.
+
+    Since the module is not executed, errors raised when importing it (ie. a broken top
+    level import) are not detected here. They are only reported when the module is
+    imported, see the 'import_modules' argument of add_module_plugin.
+
+    Parameters
+    ----------
+    package: str
+        The current GeoIPS package being parsed
+    relpath: str
+        The relpath path to the module plugin
+    abspath: str or pathlib.Path
+        The absolute path to the module plugin
+
+    Returns
+    -------
+    parsed: tuple or None
+        None if the module must be imported, otherwise a tuple of
+        (error_message, interface_name, name, plugin_entry) matching the return of
+        _import_module_plugin.
+    """
+    try:
+        with open(abspath, "rb") as module_file:
+            tree = ast.parse(module_file.read(), filename=str(abspath))
+    except (SyntaxError, ValueError):
+        # Let the import report the error.
+        return None
+
+    attr_names = ("interface", "family", "name", "source_names", "call")
+    attrs = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and all(
+            isinstance(target, ast.Name) for target in node.targets
+        ):
+            targets = [target.id for target in node.targets]
+            try:
+                value = ast.literal_eval(node.value)
+            except (ValueError, TypeError, SyntaxError):
+                value = _NOT_LITERAL
+            for target in targets:
+                if target in attr_names:
+                    attrs.setdefault(target, []).append(value)
+        elif isinstance(node, ast.FunctionDef) and node.name == "call":
+            attrs.setdefault("call", []).append(node)
+        elif _binds_any(node, attr_names):
+            # Bound some other way (import, if / try block, class, loop, ...).
+            return None
+
+    def get_attr(attr):
+        """Return the attribute's single literal value (or function node)."""
+        values = attrs.get(attr, [])
+        if len(values) != 1 or values[0] is _NOT_LITERAL:
+            raise LookupError(attr)
+        return values[0]
+
+    try:
+        interface_name = get_attr("interface")
+        if not interface_name:
+            # A helper module which is not a plugin.
+            return "", None, None, None
+        name = get_attr("name")
+        family = get_attr("family")
+        call = get_attr("call")
+        if not isinstance(call, ast.FunctionDef):
+            return None
+        call_signature = _literal_signature(call)
+        has_source_names = "source_names" in attrs
+        source_names = get_attr("source_names") if has_source_names else None
+    except LookupError:
+        return None
+    plugin_entry = _module_plugin_entry(
+        package,
+        relpath,
+        interface_name,
+        name,
+        family,
+        ast.get_docstring(tree, clean=False),
+        call_signature,
+        has_source_names,
+        source_names,
+    )
+    return "", interface_name, name, plugin_entry
+
+
+def _binds_any(node, names):
+    """Return whether a top level statement binds any of the provided names."""
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return any(
+            (alias.asname or alias.name.split(".")[0]) in names for alias in node.names
+        )
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return node.name in names
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name) and isinstance(child.ctx, (ast.Store, ast.Del)):
+            if child.id in names:
+                return True
+        elif isinstance(child, (ast.Import, ast.ImportFrom)) and _binds_any(
+            child, names
+        ):
+            return True
+        elif isinstance(
+            child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        ) and (child.name in names):
+            return True
+    return False
+
+
+def _literal_signature(func_node):
+    """Return str(inspect.signature(func)) for a function, from its syntax tree.
+
+    Only supported for undecorated functions without annotations whose default values
+    are all literals, since otherwise the signature depends on objects only available
+    once the module has been imported.
+
+    Raises
+    ------
+    LookupError
+        If the signature can't be determined without importing the module.
+    """
+    from inspect import Parameter, Signature
+
+    args = func_node.args
+    if func_node.decorator_list or func_node.returns:
+        raise LookupError("call")
+    positional = args.posonlyargs + args.args
+    all_args = positional + args.kwonlyargs
+    all_args += [arg for arg in (args.vararg, args.kwarg) if arg]
+    if any(arg.annotation for arg in all_args):
+        raise LookupError("call")
+    try:
+        pos_defaults = [ast.literal_eval(dflt) for dflt in args.defaults]
+        kw_defaults = [
+            Parameter.empty if dflt is None else ast.literal_eval(dflt)
+            for dflt in args.kw_defaults
+        ]
+    except (ValueError, TypeError, SyntaxError):
+        raise LookupError("call")
+    pos_defaults = [Parameter.empty] * (
+        len(positional) - len(pos_defaults)
+    ) + pos_defaults
+
+    params = []
+    for idx, (arg, dflt) in enumerate(zip(positional, pos_defaults)):
+        if idx < len(args.posonlyargs):
+            kind = Parameter.POSITIONAL_ONLY
+        else:
+            kind = Parameter.POSITIONAL_OR_KEYWORD
+        params.append(Parameter(arg.arg, kind, default=dflt))
+    if args.vararg:
+        params.append(Parameter(args.vararg.arg, Parameter.VAR_POSITIONAL))
+    for arg, dflt in zip(args.kwonlyargs, kw_defaults):
+        params.append(Parameter(arg.arg, Parameter.KEYWORD_ONLY, default=dflt))
+    if args.kwarg:
+        params.append(Parameter(args.kwarg.arg, Parameter.VAR_KEYWORD))
+    return str(Signature(params))
+
+
+def _import_module_plugin(package, relpath, abspath, module_name):
+    """Import a module plugin and build its plugin registry entry.
+
+    Parameters
+    ----------
+    package: str
+        The current GeoIPS package being parsed
+    relpath: str
+        The relpath path to the module plugin
+    abspath: str or pathlib.Path
+        The absolute path to the module plugin
+    module_name: str
+        The name of the module, without its extension
+
+    Returns
+    -------
+    error_message: str
+        Informative error message if the module was improperly formatted, otherwise
+        the empty string.
+    interface_name: str or None
+        The interface of the plugin, None for helper modules which are not plugins.
+    name: str or None
+        The name of the plugin, None if interface_name is None.
+    plugin_entry: dict or None
+        The plugin registry entry for this plugin, None if interface_name is None.
+    """
+    error_message = ""
     # We need the full path to the module in order
     # for relative imports to work within modules.
     module_path = splitext(relpath.replace("/", "."))[0]
     module_path = f"{package}.{module_path}"
-    abspath = resources.files(package) / relpath
 
     spec = util.spec_from_file_location(module_path, abspath)
 
@@ -781,7 +1269,7 @@ def add_module_plugin(package, relpath, plugins):
                          Failed importing '{module_name}' in
                          package '{package}'
                          at relpath '{relpath}'\n"""
-        return error_message
+        return error_message, None, None, None
     # Try to get "interface" variable from the module.  This is required
     # on ALL files within the python module based plugins directory, to
     # ensure create_plugin_registries can explicitly tell whether a file
@@ -811,18 +1299,14 @@ def add_module_plugin(package, relpath, plugins):
                 'interface = None' must be specified at the top level for modules
                 within the plugins subdirectory that are not intended to be
                 GeoIPS plugins on their own."""
-        return error_message
+        return error_message, None, None, None
     # If interface is None, then legitimately skip the module.
     # We want to skip this first, before we test anything else.
     # If it is not a plugin, we don't care if there are other
     # errors in it at this stage (ie, avoid unnecessary unrelated
     # catastrophic failures)
     if not interface_name:
-        LOG.interactive(
-            f"Skipping module '{module_name}' from '{package}', "
-            "interface_name is 'None'"
-        )
-        return error_message
+        return error_message, None, None, None
     # If we get here, it should be a full GeoIPS plugin, so it must include both
     # name and family variables/attributes.
     try:
@@ -834,53 +1318,20 @@ def add_module_plugin(package, relpath, plugins):
             at relpath '{relpath}'
             must specify 'interface', 'family', and 'name' variables at the
             top level of ALL module based plugins."""
-        return error_message
-    # If the current interface_name is not in the plugins dictionary yet, add it
-    # as an empty dictionary.
-    if interface_name not in plugins.keys():
-        plugins[interface_name] = {}
-    # Check_plugin_exists will return a text error message if there are any errors
-    # rather than raising an exception.  This allows collecting all errors as
-    # we go, and reporting once at the end with an error message including ALL
-    # errors found across all plugins in all plugin packages.  Append the new
-    # error message to the error messages that have already been collected.
-    error_message += check_plugin_exists(
-        package, plugins, interface_name, name, relpath
+        return error_message, None, None, None
+    plugin_entry = _module_plugin_entry(
+        package,
+        relpath,
+        interface_name,
+        name,
+        family,
+        module.__doc__,
+        str(signature(module.call)),
+        hasattr(module, "source_names"),
+        getattr(module, "source_names", None),
     )
-    # Add info shown below obtained from the module plugin. Every module plugin
-    # is required to have these entries in the registry to be considered a valid
-    # plugin.
-    plugins[interface_name][name] = {
-        "docstring": format_docstring(module.__doc__),
-        "family": family,
-        "interface": interface_name,
-        "package": package,
-        "plugin_type": "module_based",
-        "signature": str(signature(module.call)),
-        "relpath": relpath,
-    }
-    if interface_name == "readers":
-        if hasattr(module, "source_names"):
-            plugins[interface_name][name]["source_names"] = module.source_names
-        else:
-            warnings.warn(
-                (
-                    f"Plugin package '{package}'s reader"
-                    f" plugin '{name}' is using a deprecated source_names "
-                    "implementation. Please add a module-level 'source_names' "
-                    "attribute to this plugin and re-run "
-                    "'create_plugin_registries'. This will be fully deprecated "
-                    "when GeoIPS v2.0.0 is released."
-                ),
-                DeprecationWarning,
-                stacklevel=2,
-            )
-            plugins[interface_name][name]["source_names"] = ["Unspecified"]
     del module
-    # Return the final error message - an exception will be raised at the very
-    # end after collecting and reporting on all errors if there were any errors
-    # during plugin registry creation.
-    return error_message
+    return error_message, interface_name, name, plugin_entry
 
 
 def get_parser():
@@ -912,6 +1363,23 @@ def get_parser():
         default=None,
         help="Package name to create registries for. If not specified, run on all.",
     )
+    parser.add_argument(
+        "--ignore_cache",
+        action="store_true",
+        help=(
+            "Rebuild the registry entry of every module plugin, rather than reusing "
+            "the cached entries of module plugins that have not changed."
+        ),
+    )
+    parser.add_argument(
+        "--import_modules",
+        action="store_true",
+        help=(
+            "Import every module plugin, rather than reading its attributes from its "
+            "source where possible. This is slower, but reports any module plugins "
+            "which fail to import."
+        ),
+    )
     return parser
 
 
@@ -936,14 +1404,19 @@ def main():
     LOG = setup_logging(logging_level="INTERACTIVE")
     # Note: Python 3.9 appears to return duplicates when installed with setuptools.
     # These are filtered within the create_plugin_registries function.
-    plugin_packages = metadata.entry_points(group="geoips.plugin_packages")
+    plugin_packages = get_entry_point_group("geoips.plugin_packages")
     if package_name:
         for plugin_package in plugin_packages:
             if plugin_package.name == package_name:
                 use_plugin_package = plugin_package
         plugin_packages = [use_plugin_package]
     LOG.debug(plugin_packages)
-    create_plugin_registries(plugin_packages, save_type)
+    create_plugin_registries(
+        plugin_packages,
+        save_type,
+        use_cache=not ARGS.ignore_cache,
+        import_modules=ARGS.import_modules,
+    )
     sys.exit(0)
 
 
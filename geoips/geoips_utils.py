@@ -4,6 +4,7 @@
 """General high level utilities for geoips processing."""
 
 import argparse
+from functools import lru_cache
 import inspect
 import os
 from copy import deepcopy
@@ -22,6 +23,26 @@ from geoips.filenames.base_paths import PATHS as geoips_paths
 LOG = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_entry_point_group(group):
+    """Return the installed entry points registered under the provided group.
+
+    metadata.entry_points scans the metadata of every installed distribution, so only
+    do that once per group for the lifetime of the process.
+
+    Parameters
+    ----------
+    group: str
+        - The entry point group to retrieve, ie. "geoips.plugin_packages".
+
+    Returns
+    -------
+    entry_points: importlib.metadata.EntryPoints
+        - The entry points registered under the provided group.
+    """
+    return metadata.entry_points(group=group)
+
+
 def remove_unsupported_kwargs(module, requested_kwargs):
     """Remove unsupported keyword arguments."""
     module_args = set(inspect.signature(module).parameters.keys())
@@ -54,7 +75,7 @@ def find_all_txt_plugins(subdir=""):
     in ``.txt``. Return list of files
     """
     # Load all entry points for plugin packages
-    plugin_packages = metadata.entry_points(group="geoips.plugin_packages")
+    plugin_packages = get_entry_point_group("geoips.plugin_packages")
 
     # Loop over the plugin packages and load all of their yaml plugins
     txt_files = []
@@ -74,7 +95,7 @@ def load_all_yaml_plugins():
     # Load all entry points for plugin packages
     import json
 
-    plugin_packages = metadata.entry_points(group="geoips.plugin_packages")
+    plugin_packages = get_entry_point_group("geoips.plugin_packages")
     yaml_plugins = {}
     for pkg in plugin_packages:
         pkg_plug_path = str(resources.files(pkg.value) / "registered_plugins")
@@ -472,22 +493,29 @@ def merge_nested_dicts(dest, src, in_place=True, replace=False):
                 final_dest[key] = src[key]
         return final_dest
 
-    try:
-        final_dest.update(src | final_dest)
-    except (AttributeError, TypeError):
+    if not isinstance(final_dest, dict) or not isinstance(src, dict):
         return
-    try:
-        for key, val in final_dest.items():
-            try:
-                merge_nested_dicts(final_dest[key], src[key])
-            except KeyError:
-                pass
-    except AttributeError:
-        raise
+    _merge_missing_items(final_dest, src)
     if not in_place:
         return final_dest
 
 
+def _merge_missing_items(dest, src):
+    """Recursively add the items of src which are missing from dest, in place.
+
+    Values which already exist in dest are preserved, and nested dictionaries found in
+    both dest and src are merged. Only keys found in both are recursed into, so no
+    intermediate dictionaries are created.
+    """
+    for key, src_val in src.items():
+        if key not in dest:
+            dest[key] = src_val
+            continue
+        dest_val = dest[key]
+        if isinstance(dest_val, dict) and isinstance(src_val, dict):
+            _merge_missing_items(dest_val, src_val)
+
+
 def expose_geoips_commands(pkg_name=None, _test_log=None):
     """Expose a list of commands that operate in the GeoIPS environment.
 
@@ -509,7 +537,7 @@ def expose_geoips_commands(pkg_name=None, _test_log=None):
     eps = list(
         filter(
             lambda ep: pkg_name in ep.value,
-            metadata.entry_points().select(group="console_scripts"),
+            get_entry_point_group("console_scripts"),
         )
     )
     log.interactive("-" * len(f"Available {pkg_name.title()} Commands"))
@@ -561,7 +589,7 @@ def _get_pkg_name_and_logger(pkg_name, provided_log):
           output it.
     """
     plugin_packages = [
-        str(ep.value) for ep in metadata.entry_points(group="geoips.plugin_packages")
+        str(ep.value) for ep in get_entry_point_group("geoips.plugin_packages")
     ]
     if provided_log:
         log = provided_log
@@ -610,7 +638,7 @@ def is_editable(package_name):
           mode.
     """
     plugin_package_names = [
-        ep.value for ep in metadata.entry_points(group="geoips.plugin_packages")
+        ep.value for ep in get_entry_point_group("geoips.plugin_packages")
     ]
     if package_name not in plugin_package_names:
         raise ValueError(
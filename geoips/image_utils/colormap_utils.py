@@ -3,6 +3,7 @@
 
 """Module for generating specific colormaps on the fly."""
 # Installed Libraries
+from functools import lru_cache
 import logging
 import ast
 
@@ -152,6 +153,49 @@ def set_mpl_colors_info_dict(
     return mpl_colors_info
 
 
+@lru_cache(maxsize=128)
+def _read_ascii_palette(fname):
+    """Read an ASCII file of RGB values into a normalized NLines by 3 float array.
+
+    Palettes are static plugin files which are often used repeatedly within a single
+    process (ie. once per product), so each one is only read and parsed once. The
+    returned array is read-only since it is shared between all callers.
+
+    See from_ascii for the supported file format.
+    """
+    import numpy
+
+    # Read data from ascii file into an NLines by 3 float array, skipping
+    # lines preceded by "#"
+    try:
+        carray = numpy.loadtxt(fname, comments="#", dtype=numpy.float64, ndmin=2)
+    except ValueError as resp:
+        raise ValueError(f"Invalid RGB values in ascii palette {fname}: {resp}")
+    if carray.shape[1] != 3:
+        raise ValueError(
+            f"Expected 3 RGB values per line in ascii palette {fname}, "
+            f"found {carray.shape[1]}."
+        )
+
+    # Find the bounds once, rather than rescanning carray for each check below.
+    # Dividing by 255 preserves the ordering of values, so the bounds can be
+    # normalized along with carray.
+    carray_min, carray_max = carray.min(), carray.max()
+
+    # Normalize from 0-255 to 0.0-1.0
+    if carray_max > 1.0:
+        carray /= 255.0
+        carray_min /= 255.0
+        carray_max /= 255.0
+
+    # Test to be sure all color array values are between 0.0 and 1.0
+    if not (carray_min >= 0.0 and carray_max <= 1.0):
+        raise ValueError("All values in carray must be between 0.0 and 1.0.")
+
+    carray.flags.writeable = False
+    return carray
+
+
 def from_ascii(fname, cmap_name=None, reverse=False):
     """Create a ListedColormap instance from an ASCII file of RGB values.
 
@@ -177,28 +221,10 @@ def from_ascii(fname, cmap_name=None, reverse=False):
        for matplotlib usage)
      * One white space delimited RGB value per line
     """
-    # Read data from ascii file into an NLines by 3 float array, skipping
-    # lines preceded by "#"
-    lines = []
-    with open(fname) as palette:
-        for line in palette.readlines():
-            if line.strip()[0] != "#":
-                lines += [line]
-
     import numpy
 
-    carray = numpy.zeros([len(lines), len(lines[0].strip().split())])
-    # carray = numpy.zeros([len(lines), 3])
-    for num, line in enumerate(lines):
-        carray[num, :] = [float(val) for val in line.strip().split()]
-
-    # Normalize from 0-255 to 0.0-1.0
-    if carray.max() > 1.0:
-        carray /= 255.0
-
-    # Test to be sure all color array values are between 0.0 and 1.0
-    if not (carray.min() >= 0.0 and carray.max() <= 1.0):
-        raise ValueError("All values in carray must be between 0.0 and 1.0.")
+    # The cached array is shared between callers, so give each colormap its own copy.
+    carray = _read_ascii_palette(fname).copy()
 
     if reverse is True:
         carray = numpy.flipud(carray)
@@ -217,12 +217,25 @@ def save_image(
         if remove_duplicate_minrange is not None:
             remove_duplicates(out_fname, remove_duplicate_minrange)
 
+    log_image_success(out_fname, image_datetime)
+    return [out_fname]
+
+
+def log_image_success(out_fname, image_datetime=None):
+    """Log that the image out_fname was successfully written.
+
+    Parameters
+    ----------
+    out_fname : str
+        full path to the output filename
+    image_datetime : datetime.datetime, default=None
+        If specified, also log the latency of out_fname relative to image_datetime.
+    """
     LOG.info("IMAGESUCCESS wrote %s", out_fname)
     if image_datetime is not None:
         from datetime import datetime
 
         LOG.info("LATENCY %s %s", datetime.utcnow() - image_datetime, out_fname)
-    return [out_fname]
 
 
 def remove_duplicates(fname, min_range):
@@ -992,6 +992,9 @@ class OutputCheckersInterface(BaseModuleInterface):
     required_args = {"standard": {}}
     required_kwargs = {"standard": {}}
     plugin_class = OutputCheckersBasePlugin
+    # Populated on the first call to identify_checker, see _get_candidate_checkers.
+    _checker_plugins = None
+    _candidate_checkers = None
     # required_args = {
     #     "standard": ["fname", "output_product", "compare_product"],
     #     "print_gunzip": ["fobj", "gunzip_fname"],
@@ -1014,7 +1017,7 @@ class OutputCheckersInterface(BaseModuleInterface):
             filename = gunzip_product(
                 filename, is_comparison_product=False, clobber=True
             )
-        for output_checker in self.get_plugins():
+        for output_checker in self._get_candidate_checkers(splitext(filename)[-1]):
             checker_found = output_checker.module.correct_file_format(filename)
             if checker_found:
                 checker_name = output_checker.module.name
@@ -1023,6 +1026,39 @@ class OutputCheckersInterface(BaseModuleInterface):
             raise TypeError("There isn't an output checker built for this data type.")
         return checker_name
 
+    def _get_candidate_checkers(self, extension):
+        """Return the output checker plugins which may handle files with extension.
+
+        Output checker plugins may declare the file extensions they handle via a
+        module level 'handled_extensions' attribute. Plugins which declare extensions
+        are only candidates for files with one of those extensions, while plugins
+        which do not (ie. checkers that inspect the file contents) are candidates for
+        every file. Plugins are loaded once, and the candidates for each extension are
+        cached, so identifying checkers for many output products does not ask every
+        plugin about every file.
+
+        Parameters
+        ----------
+        extension : str
+            - The file extension (including the leading '.') of the output product.
+
+        Returns
+        -------
+        candidates: list of OutputCheckersBasePlugin
+            - The candidate plugins, in the order returned by get_plugins.
+        """
+        if self._candidate_checkers is None:
+            self._checker_plugins = self.get_plugins()
+            self._candidate_checkers = {}
+        if extension not in self._candidate_checkers:
+            self._candidate_checkers[extension] = [
+                output_checker
+                for output_checker in self._checker_plugins
+                if extension
+                in getattr(output_checker.module, "handled_extensions", [extension])
+            ]
+        return self._candidate_checkers[extension]
+
     def get_plugin(self, name, rebuild_registries=None):
         """Return the output checker plugin corresponding to checker_name.
 
@@ -3,6 +3,7 @@
 
 """Products interface module."""
 
+from copy import deepcopy
 import logging
 from geoips.geoips_utils import merge_nested_dicts
 from geoips.interfaces.base import YamlPluginValidator, BaseYamlInterface
@@ -86,6 +87,14 @@ class ProductsInterface(BaseYamlInterface):
     name = "products"
     validator = ProductsPluginValidator()
 
+    def __init__(self):
+        """Products interface init method."""
+        super().__init__()
+        # Validated product plugins, keyed by (source_name, name). Reading, validating
+        # and merging a product with its product_defaults is expensive, and the same
+        # products are typically requested many times within a single process.
+        self._plugin_cache = {}
+
     def _create_registered_plugin_names(self, yaml_plugin):
         """Create a plugin name for plugin registry.
 
@@ -150,7 +159,14 @@ class ProductsInterface(BaseYamlInterface):
               get_plugin once more with rebuild_registries toggled off, so it only gets
               rebuilt once.
         """
-        prod_plugin = super().get_plugin((source_name, name), rebuild_registries)
+        try:
+            cached_plugin = self._plugin_cache[(source_name, name)]
+        except KeyError:
+            cached_plugin = super().get_plugin((source_name, name), rebuild_registries)
+            self._plugin_cache[(source_name, name)] = cached_plugin
+        # Callers are free to modify the returned plugin, so never hand out the cached
+        # plugin itself.
+        prod_plugin = deepcopy(cached_plugin)
         if product_spec_override is not None:
             # Default to no override arguments
             override_args = {}
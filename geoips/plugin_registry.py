@@ -17,9 +17,11 @@ more effectively cache plugins across all interfaces, and avoid reading
 in all plugins multiple times.
 """
 
-from importlib import metadata, resources
+from functools import cached_property, lru_cache
+from importlib import resources
 import os
 import logging
+import pickle
 from geoips.errors import PluginRegistryError
 import yaml
 import json
@@ -27,6 +29,74 @@ import json
 
 LOG = logging.getLogger(__name__)
 
+# Use the libyaml C implementation when available, it is several times faster than the
+# pure python loader.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def get_registry_path(package_name):
+    """Return the path to the 'registered_plugins.json' of a package.
+
+    Resolving a package via importlib.resources searches the import machinery each
+    time, so only do so once per package.
+
+    Parameters
+    ----------
+    package_name: str
+        - The name of the GeoIPS plugin package.
+
+    Returns
+    -------
+    reg_path: str
+        - Full path to the package's 'registered_plugins.json' file.
+    """
+    return str(resources.files(package_name) / "registered_plugins.json")
+
+
+def load_registry_json(reg_path):
+    """Load a 'registered_plugins.json' file, using a pickled copy when possible.
+
+    Deserializing a pickle is considerably faster than parsing the equivalent JSON, so
+    the first time a registry is parsed a 'registered_plugins.pkl' is written alongside
+    it. That pickle is used on subsequent calls as long as it is newer than the JSON
+    file. If the pickle can't be written (ie. a read-only install), the JSON file is
+    parsed every time.
+
+    Parameters
+    ----------
+    reg_path: str
+        - Full path to the 'registered_plugins.json' file.
+
+    Returns
+    -------
+    registry: dict
+        - The contents of the plugin registry.
+    """
+    pkl_path = os.path.splitext(reg_path)[0] + ".pkl"
+    try:
+        if os.path.getmtime(pkl_path) > os.path.getmtime(reg_path):
+            with open(pkl_path, "rb") as pkl_file:
+                return pickle.load(pkl_file)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        # Missing, unreadable, or truncated pickle. Fall back to the JSON registry.
+        pass
+
+    with open(reg_path, "r") as reg_file:
+        registry = json.load(reg_file)
+    # Write to a temporary file then move it into place, so concurrent processes
+    # never read a partially written pickle.
+    tmp_path = f"{pkl_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as pkl_file:
+            pickle.dump(registry, pkl_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pkl_path)
+    except OSError as resp:
+        LOG.debug(f"Unable to cache plugin registry {reg_path} as {pkl_path}: {resp}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return registry
+
 
 class PluginRegistry:
     """Plugin Registry class definition.
@@ -43,13 +113,13 @@ class PluginRegistry:
             self._is_test = True
         # Use this for normal operation and collect the registry files
         else:
+            from geoips.geoips_utils import get_entry_point_group
+
             self._is_test = False
             self.registry_files = []  # Collect the paths to the registry files here
-            for pkg in metadata.entry_points(group="geoips.plugin_packages"):
+            for pkg in get_entry_point_group("geoips.plugin_packages"):
                 try:
-                    self.registry_files.append(
-                        str(resources.files(pkg.value) / "registered_plugins.json")
-                    )
+                    self.registry_files.append(get_registry_path(pkg.value))
                 except TypeError:
                     raise PluginRegistryError(
                         f"resources.files('{pkg.value}') failed\n"
@@ -104,29 +174,28 @@ class PluginRegistry:
                 # This will include all plugins, including schemas, yaml_based,
                 # and module_based plugins.
                 if self._is_test:
-                    pkg_plugins = yaml.safe_load(open(reg_path, "r"))
+                    with open(reg_path, "r") as reg_file:
+                        pkg_plugins = yaml.load(reg_file, Loader=SafeLoader)
                 else:
-                    pkg_plugins = json.load(open(reg_path, "r"))
+                    pkg_plugins = load_registry_json(reg_path)
                     # Do not validate ALL plugins at runtime.
                     # self.validate_registry(pkg_plugins, reg_path)
                 try:
-                    for plugin_type in pkg_plugins:
-                        if plugin_type not in self._registered_plugins:
-                            self._registered_plugins[plugin_type] = {}
-                            self._interface_mapping[plugin_type] = []
-                        for interface in pkg_plugins[plugin_type]:
-                            interface_dict = pkg_plugins[plugin_type][interface]
-                            if interface not in self._registered_plugins[plugin_type]:
-                                self._registered_plugins[plugin_type][
-                                    interface
-                                ] = interface_dict  # NOQA
-                                self._interface_mapping[plugin_type].append(interface)
+                    for plugin_type, type_plugins in pkg_plugins.items():
+                        type_registry = self._registered_plugins.setdefault(
+                            plugin_type, {}
+                        )
+                        type_interfaces = self._interface_mapping.setdefault(
+                            plugin_type, []
+                        )
+                        for interface, interface_dict in type_plugins.items():
+                            existing_dict = type_registry.get(interface)
+                            if existing_dict is None:
+                                type_registry[interface] = interface_dict
+                                type_interfaces.append(interface)
                             else:
-                                merge_nested_dicts(
-                                    self._registered_plugins[plugin_type][interface],
-                                    interface_dict,
-                                )
-                except TypeError:
+                                merge_nested_dicts(existing_dict, interface_dict)
+                except (AttributeError, TypeError):
                     raise PluginRegistryError(f"Failed reading {reg_path}.")
             # Let's test this separately, not at runtime (see validate_all_registries).
             # Assume it was tested up front, and no longer needs testing at
@@ -178,18 +247,27 @@ class PluginRegistry:
         plugin_type = self.identify_plugin_type(interface)
         return self.registered_plugins[plugin_type][interface]
 
+    @cached_property
+    def _interface_plugin_types(self):
+        """Invert interface_mapping into an interface -> plugin_type dictionary.
+
+        Every plugin lookup goes through identify_plugin_type, so rather than
+        searching each list in interface_mapping every time, build this once.
+        """
+        interface_plugin_types = {}
+        for p_type, interfaces in self.interface_mapping.items():
+            for interface_name in interfaces:
+                interface_plugin_types.setdefault(interface_name, p_type)
+        return interface_plugin_types
+
     def identify_plugin_type(self, interface):
         """Identify the Plugin Type based on the provided interface."""
-        plugin_type = None
-        for p_type in self.interface_mapping:
-            if interface in self.interface_mapping[p_type]:
-                plugin_type = p_type
-                break
-        if plugin_type is None:
+        try:
+            return self._interface_plugin_types[interface]
+        except KeyError:
             raise PluginRegistryError(
                 f"{interface} does not exist within any package registry."
             )
-        return plugin_type
 
 
 plugin_registry = PluginRegistry()
@@ -8,6 +8,8 @@ This algorithm expects Brightness Temperatures in units of degrees Kelvin
 """
 import logging
 
+from geoips.data_manipulations.corrections import apply_data_range, apply_gamma
+
 LOG = logging.getLogger(__name__)
 
 interface = "algorithms"
@@ -36,9 +38,10 @@ def call(arrays):
     h37 = arrays[0]
     v37 = arrays[1]
 
-    from geoips.data_manipulations.corrections import apply_data_range, apply_gamma
-
-    red = 2.181 * v37 - 1.181 * h37
+    # Build each gun with in-place operations where possible, to avoid allocating a
+    # full size temporary array for every arithmetic step on large swaths.
+    red = v37 * 2.181
+    red -= 1.181 * h37
     red = apply_data_range(
         red,
         260.0,
@@ -50,7 +53,8 @@ def call(arrays):
     )
     red = apply_gamma(red, 1.0)
 
-    grn = (v37 - 180.0) / (300.0 - 180.0)
+    grn = v37 - 180.0
+    grn /= 300.0 - 180.0
     grn = apply_data_range(
         grn,
         0.0,
@@ -62,7 +66,8 @@ def call(arrays):
     )
     grn = apply_gamma(grn, 1.0)
 
-    blu = (h37 - 160.0) / (300.0 - 160.0)
+    blu = h37 - 160.0
+    blu /= 300.0 - 160.0
     blu = apply_data_range(
         blu,
         0.0,
@@ -74,6 +79,7 @@ def call(arrays):
     )
     blu = apply_gamma(blu, 1.0)
 
+    # mpl_utils imports matplotlib, so only import it once the product is created.
     from geoips.image_utils.mpl_utils import alpha_from_masked_arrays, rgba_from_arrays
 
     alp = alpha_from_masked_arrays([red, grn, blu])
@@ -13,6 +13,8 @@ LOG = logging.getLogger(__name__)
 interface = "output_checkers"
 family = "standard"
 name = "image"
+# File extensions handled by this checker, see correct_file_format.
+handled_extensions = [".png", ".jpg", ".jpeg"]
 
 
 def get_test_files(test_data_dir):
@@ -31,17 +33,26 @@ def get_test_files(test_data_dir):
     # Relates to thresholds [0.1, 0.05, 0.0]
     compare_files = []
     test_files = []
+    # float32 is plenty of precision for 8 bit images, and halves the memory used.
+    rng = np.random.default_rng()
     for threshold in thresholds:
         for i in range(3):
-            comp_arr = np.random.rand(100, 100, 3)
-            test_arr = np.copy(comp_arr)
+            comp_arr = rng.random((100, 100, 3), dtype=np.float32)
+            if i == 2:
+                test_arr = rng.random((100, 100, 3), dtype=np.float32)
+            else:
+                test_arr = comp_arr.copy()
             if i == 1:
-                rand = np.random.randint(0, 100)
-                test_arr[rand][:] = np.random.rand(3)
-            elif i == 2:
-                test_arr = np.random.rand(100, 100, 3)
-            comp_img = Image.fromarray((comp_arr * 255).astype(np.uint8))
-            test_img = Image.fromarray((test_arr * 255).astype(np.uint8))
+                rand = rng.integers(0, 100)
+                test_arr[rand][:] = rng.random(3, dtype=np.float32)
+            # Scale directly into the 8 bit arrays, rather than creating a scaled
+            # float array and then casting a copy of it.
+            comp_uint8 = np.empty(comp_arr.shape, dtype=np.uint8)
+            test_uint8 = np.empty(test_arr.shape, dtype=np.uint8)
+            np.multiply(comp_arr, 255, out=comp_uint8, casting="unsafe")
+            np.multiply(test_arr, 255, out=test_uint8, casting="unsafe")
+            comp_img = Image.fromarray(comp_uint8)
+            test_img = Image.fromarray(test_uint8)
             comp_file = join(savedir, f"comp_img_{threshold}{str(i)}.png")
             test_file = join(savedir, f"test_img_{threshold}{str(i)}.png")
             comp_img.save(comp_file)
@@ -81,7 +92,7 @@ def correct_file_format(fname):
     bool
         True if it is an image file, False otherwise.
     """
-    if splitext(fname)[-1] in [".png", ".jpg", ".jpeg"]:
+    if splitext(fname)[-1] in handled_extensions:
         return True
     return False
 
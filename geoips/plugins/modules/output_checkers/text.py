@@ -3,6 +3,8 @@
 
 """Test script for representative product comparisons."""
 
+import codecs
+import filecmp
 import subprocess
 import logging
 from os.path import splitext
@@ -12,6 +14,8 @@ LOG = logging.getLogger(__name__)
 interface = "output_checkers"
 family = "standard"
 name = "text"
+# File extensions handled by this checker, see correct_file_format.
+handled_extensions = ["", ".txt", ".text", ".yaml"]
 
 
 def clear_text(match_path, close_path, bad_path):
@@ -95,12 +99,19 @@ def correct_file_format(fname):
     bool
         True if it is a text file, False otherwise.
     """
-    if splitext(fname)[-1] in ["", ".txt", ".text", ".yaml"]:
-        with open(fname) as f:
-            line = f.readline()
-        if isinstance(line, str):
-            return True
-    return False
+    if splitext(fname)[-1] not in handled_extensions:
+        return False
+    # Only inspect the start of the file, which is enough to reject binary files (those
+    # containing null bytes or invalid utf-8). An incremental decoder is used so a
+    # multi-byte character split at the end of the chunk is not mistaken for invalid
+    # text.
+    try:
+        with open(fname, "rb") as f:
+            chunk = f.read(512)
+        codecs.getincrementaldecoder("utf-8")().decode(chunk)
+    except (OSError, UnicodeDecodeError):
+        return False
+    return b"\0" not in chunk
 
 
 def outputs_match(plugin, output_product, compare_product):
@@ -122,13 +133,14 @@ def outputs_match(plugin, output_product, compare_product):
     """
     from geoips.commandline.log_setup import log_with_emphasis
 
-    ret = subprocess.run(
-        ["diff", output_product, compare_product],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-    LOG.debug(ret.stdout)
-    if ret.returncode == 0:
+    # Matching files are the common case, so compare them in process and only run
+    # 'diff' to write out the differences when they don't match.
+    try:
+        files_match = filecmp.cmp(output_product, compare_product, shallow=False)
+    except OSError as resp:
+        LOG.debug("Unable to compare text files: %s", resp)
+        files_match = False
+    if files_match:
         log_with_emphasis(LOG.info, "GOOD Text files match")
         return True
 
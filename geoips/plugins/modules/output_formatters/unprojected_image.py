@@ -4,12 +4,14 @@
 """Matplotlib-based unprojected image output."""
 
 import logging
-from os.path import basename, dirname, join
+from os.path import basename, dirname, exists, join, splitext
+from shutil import copyfile
 
 import matplotlib.pyplot as plt
 import matplotlib
 
-from geoips.image_utils.mpl_utils import save_image
+from geoips.filenames.base_paths import make_dirs
+from geoips.image_utils.mpl_utils import log_image_success, save_image
 
 matplotlib.use("agg")
 
@@ -82,6 +84,9 @@ def call(
         )
 
         success_outputs = []
+        # The rendered figure is identical for every output filename, so only save it
+        # once per file format, and copy that file to any remaining filenames.
+        rendered_fnames = {}
         for fname in output_fnames:
             if is_3d:
                 # This is generic for overcast data, on the order of (level) * 0.5 km.
@@ -113,6 +118,16 @@ def call(
                 )
             else:
                 final_fname = fname
+            rendered_fname = rendered_fnames.get(splitext(final_fname)[1])
+            if rendered_fname is not None:
+                LOG.info("Copying %s to %s", rendered_fname, final_fname)
+                if not exists(dirname(final_fname)):
+                    make_dirs(dirname(final_fname))
+                if final_fname != rendered_fname:
+                    copyfile(rendered_fname, final_fname)
+                log_image_success(final_fname, xarray_obj.start_datetime)
+                success_outputs += [final_fname]
+                continue
             LOG.info("Plotting %s with plt", fname)
             # This just handles cleaning up the axes, creating directories, etc
             success_outputs += save_image(
@@ -122,5 +137,6 @@ def call(
                 image_datetime=xarray_obj.start_datetime,
                 savefig_kwargs=savefig_kwargs,
             )
+            rendered_fnames[splitext(final_fname)[1]] = final_fname
 
     return success_outputs
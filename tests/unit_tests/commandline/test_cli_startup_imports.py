@@ -0,0 +1,69 @@
+# # # This source code is protected under the license referenced at
+# # # https://github.com/NRLMMD-GEOIPS.
+
+"""Unit tests ensuring the CLI only initializes what the requested command needs.
+
+matplotlib (and its font cache / backend initialization) is only needed once a plugin
+actually produces imagery. Building the CLI for commands which only inspect the plugin
+registries should not import it, nor should it import unrelated top-level commands.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from geoips.commandline.commandline_interface import GeoipsCLI
+
+STARTUP_CHECK = """
+import sys
+sys.argv = {argv!r}
+from geoips.commandline.commandline_interface import GeoipsCLI
+GeoipsCLI()
+print("imported:" + ",".join(m for m in ("matplotlib", "cartopy") if m in sys.modules))
+"""
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["geoips", "-h"],
+        ["geoips", "list", "packages"],
+        ["geoips", "describe", "algorithms", "single_channel"],
+    ],
+    ids=lambda argv: " ".join(argv),
+)
+def test_cli_startup_does_not_import_matplotlib(argv):
+    """Ensure initializing the CLI doesn't import matplotlib or cartopy.
+
+    This is run in a separate interpreter since other unit tests will have already
+    imported matplotlib in the current process.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_CHECK.format(argv=argv)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "imported:"
+
+
+@pytest.mark.parametrize(
+    "argv, expected_commands",
+    [
+        (["geoips", "list", "packages"], ["list"]),
+        (["geoips", "ls", "packages"], ["list"]),
+        (["geoips", "--log-level", "info", "describe", "pkg"], ["describe"]),
+        (["geoips", "tree"], list(GeoipsCLI.command_class_paths)),
+        (["geoips", "-h"], list(GeoipsCLI.command_class_paths)),
+        (["geoips", "non_existent_command"], list(GeoipsCLI.command_class_paths)),
+    ],
+    ids=lambda param: " ".join(param) if param[0] == "geoips" else None,
+)
+def test_cli_initializes_requested_commands(monkeypatch, argv, expected_commands):
+    """Ensure only the requested top-level command is initialized, when possible."""
+    monkeypatch.setattr(sys, "argv", argv)
+    geoips_cli = GeoipsCLI()
+    assert [cmd_cls.name for cmd_cls in geoips_cli.command_classes] == (
+        expected_commands
+    )
@@ -16,11 +16,14 @@ from geoips import logging
 from geoips.commandline.log_setup import log_with_emphasis
 
 LOG = logging.getLogger(__name__)
+# Messages are generated while collecting tests, so use a seeded generator to test (and
+# collect) the same messages on every run without reseeding the global generator.
+RNG = random.Random(0)
 
 
 def generate_random_string(length):
     """Generate a random string of length :param length."""
-    return "".join(random.choices(string.ascii_letters, k=length))
+    return "".join(RNG.choices(string.ascii_letters, k=length))
 
 
 def insert_word_like_spaces_to_string(string):
@@ -41,10 +44,10 @@ def insert_word_like_spaces_to_string(string):
     >>> insert_word_like_spaces_to_string("HelloWorld")
     'He lloW or ld'
     """
-    loc = random.randint(2, 3)
+    loc = RNG.randint(2, 3)
     while loc < len(string):
         string = string[:loc] + " " + string[loc + 1 :]
-        loc += random.randint(2, 8)
+        loc += RNG.randint(2, 8)
     return string
 
 
@@ -69,7 +72,7 @@ def insert_random_string_randomly(s, length):
     >>> insert_random_string_randomly("hello", 3)
     'helXyZlo'
     """
-    position = random.randint(0, len(s) - 1)
+    position = RNG.randint(0, len(s) - 1)
     return s[position:] + generate_random_string(length) + s[position:]
 
 
@@ -77,9 +80,7 @@ def generate_random_messages(add_long_word=False):
     """Generate a random amount of messages with random length."""
     num_messages = 20
     messages = [
-        insert_word_like_spaces_to_string(
-            generate_random_string(random.randint(5, 110))
-        )
+        insert_word_like_spaces_to_string(generate_random_string(RNG.randint(5, 110)))
         for _ in range(num_messages)
     ]
     if add_long_word:
@@ -0,0 +1,45 @@
+# # # This source code is protected under the license referenced at
+# # # https://github.com/NRLMMD-GEOIPS.
+
+"""Unit tests for geoips.image_utils.colormap_utils."""
+
+import numpy
+import pytest
+
+from geoips.image_utils.colormap_utils import from_ascii
+
+
+def test_from_ascii_normalizes_and_skips_comments(tmp_path):
+    """Ensure comment and blank lines are skipped and 0-255 values are normalized."""
+    palette = tmp_path / "palette.txt"
+    palette.write_text("# interface = ascii_palettes\n#\n\n0 0 0\n  \n255 127.5 0\n\n")
+    cmap = from_ascii(str(palette))
+    assert numpy.array_equal(cmap.colors, [[0.0, 0.0, 0.0], [1.0, 0.5, 0.0]])
+
+    reversed_cmap = from_ascii(str(palette), reverse=True)
+    assert numpy.array_equal(reversed_cmap.colors, [[1.0, 0.5, 0.0], [0.0, 0.0, 0.0]])
+
+
+@pytest.mark.parametrize(
+    "contents",
+    ["0 0 0\n1 1\n", "0 0\n1 1\n", "0 0 0\n-1 0 0\n", "0 0 0\n256 0 0\n"],
+    ids=["missing-value", "two-columns", "negative", "above-255"],
+)
+def test_from_ascii_invalid_palette(tmp_path, contents):
+    """Ensure improperly formatted palettes raise a ValueError."""
+    palette = tmp_path / "palette.txt"
+    palette.write_text(contents)
+    with pytest.raises(ValueError):
+        from_ascii(str(palette))
+
+
+def test_from_ascii_reads_each_palette_once(tmp_path):
+    """Ensure palettes are cached, and each colormap has its own color array."""
+    palette = tmp_path / "palette.txt"
+    palette.write_text("0 0 0\n255 255 255\n")
+    cmap = from_ascii(str(palette))
+    # Changes to the file are not picked up, the cached palette is used instead
+    palette.write_text("invalid")
+    other_cmap = from_ascii(str(palette))
+    assert numpy.array_equal(cmap.colors, other_cmap.colors)
+    assert not numpy.shares_memory(cmap.colors, other_cmap.colors)
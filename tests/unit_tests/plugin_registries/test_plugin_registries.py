@@ -6,13 +6,14 @@
 from glob import glob
 from importlib import import_module, metadata
 import logging
-from os.path import basename, splitext
+from os import utime
+from os.path import basename, exists, getmtime, splitext
 from pprint import pformat
 import pytest
 import json
 import yaml
 
-from geoips.plugin_registry import PluginRegistry
+from geoips.plugin_registry import PluginRegistry, load_registry_json
 from geoips.errors import PluginRegistryError
 
 LOG = logging.getLogger(__name__)
@@ -239,8 +240,176 @@ class TestPluginRegistry:
         assert isinstance(self.pr_validator.interface_mapping["module_based"], list)
         assert isinstance(self.pr_validator.interface_mapping["text_based"], list)
 
+    def test_identify_plugin_type(self):
+        """Ensure every interface maps back to the plugin_type it is registered as."""
+        for plugin_type, interfaces in self.pr_validator.interface_mapping.items():
+            for interface in interfaces:
+                assert self.pr_validator.identify_plugin_type(interface) == plugin_type
+        with pytest.raises(PluginRegistryError):
+            self.pr_validator.identify_plugin_type("non_existent_interface")
+
     @pytest.mark.parametrize("fpath", pr_validator.registry_files, ids=generate_id)
     def test_all_registries(self, fpath):
         """Test all available yaml registries."""
         current_registry = yaml.safe_load(open(fpath, "r"))
         self.pr_validator.validate_registry(current_registry, fpath)
+
+
+def test_load_registry_json_pickle_cache(tmp_path):
+    """Ensure the pickled registry is written, reused, and refreshed when stale."""
+    reg_path = tmp_path / "registered_plugins.json"
+    pkl_path = tmp_path / "registered_plugins.pkl"
+    reg_path.write_text(json.dumps({"module_based": {"algorithms": {"a": {}}}}))
+
+    registry = load_registry_json(str(reg_path))
+    assert registry == {"module_based": {"algorithms": {"a": {}}}}
+    assert exists(pkl_path)
+    # The up to date pickle is used rather than the json file
+    assert load_registry_json(str(reg_path)) == registry
+
+    # Regenerating the json registry invalidates the pickle
+    reg_path.write_text(json.dumps({"module_based": {"algorithms": {"b": {}}}}))
+    utime(reg_path, (getmtime(pkl_path) + 1, getmtime(pkl_path) + 1))
+    assert load_registry_json(str(reg_path)) == {
+        "module_based": {"algorithms": {"b": {}}}
+    }
+
+
+def test_load_registry_json_corrupt_pickle(tmp_path):
+    """Ensure a truncated pickle falls back to reading the json registry."""
+    reg_path = tmp_path / "registered_plugins.json"
+    pkl_path = tmp_path / "registered_plugins.pkl"
+    reg_path.write_text(json.dumps({"text_based": {}}))
+    pkl_path.write_bytes(b"")
+    utime(pkl_path, (getmtime(reg_path) + 1, getmtime(reg_path) + 1))
+
+    assert load_registry_json(str(reg_path)) == {"text_based": {}}
+
+
+def test_add_module_plugin_file_cache():
+    """Ensure unchanged module plugins are registered from the plugin cache."""
+    from geoips.create_plugin_registries import add_module_plugin
+
+    relpath = "plugins/modules/algorithms/single_channel.py"
+    file_cache = {}
+    plugins = {}
+    assert add_module_plugin("geoips", relpath, plugins, file_cache) == ""
+    assert file_cache[relpath]["entry"] == plugins["algorithms"]["single_channel"]
+
+    # An up to date cache entry is used rather than importing the module
+    file_cache[relpath]["entry"] = {"docstring": "cached"}
+    plugins = {}
+    assert add_module_plugin("geoips", relpath, plugins, file_cache) == ""
+    assert plugins["algorithms"]["single_channel"] == {"docstring": "cached"}
+
+    # A stale cache entry causes the module to be imported again
+    file_cache[relpath]["key"] = [0, 0]
+    plugins = {}
+    assert add_module_plugin("geoips", relpath, plugins, file_cache) == ""
+    assert plugins["algorithms"]["single_channel"]["docstring"] != "cached"
+    assert file_cache[relpath]["entry"] == plugins["algorithms"]["single_channel"]
+
+
+def test_add_module_plugin_file_cache_skips_imported_modules(monkeypatch):
+    """Ensure entries of imported module plugins are rebuilt for every registry build.
+
+    basic_fname's default 'basedir' comes from GEOIPS_OUTDIRS, so it must be imported
+    and its entry must reflect the environment of the current build.
+    """
+    from geoips.create_plugin_registries import add_module_plugin
+    from geoips.filenames.base_paths import PATHS as gpaths
+
+    relpath = "plugins/modules/filename_formatters/basic_fname.py"
+    file_cache = {}
+    for outdirs in ["/tmp/geoips_outdirs_a", "/tmp/geoips_outdirs_b"]:
+        # PATHS is only derived from GEOIPS_OUTDIRS on import, so update it directly
+        monkeypatch.setenv("GEOIPS_OUTDIRS", outdirs)
+        annotated_path = f"{outdirs}/preprocessed/annotated_imagery"
+        monkeypatch.setitem(gpaths, "ANNOTATED_IMAGERY_PATH", annotated_path)
+        plugins = {}
+        assert add_module_plugin("geoips", relpath, plugins, file_cache) == ""
+        assert outdirs in plugins["filename_formatters"]["basic_fname"]["signature"]
+        assert relpath not in file_cache
+
+
+def test_add_module_plugin_import_modules(tmp_path, monkeypatch):
+    """Ensure import errors are only reported when module plugins are imported."""
+    from geoips.create_plugin_registries import add_module_plugin
+
+    module_dir = tmp_path / "broken_plugin_pkg" / "plugins" / "modules" / "algorithms"
+    module_dir.mkdir(parents=True)
+    (tmp_path / "broken_plugin_pkg" / "__init__.py").write_text("")
+    (module_dir / "broken.py").write_text(
+        '"""Algorithm plugin with a broken import."""\n'
+        "import not_an_installed_module  # noqa: F401\n"
+        'interface = "algorithms"\n'
+        'family = "list_numpy_to_numpy"\n'
+        'name = "broken"\n'
+        "def call(arrays):\n"
+        '    """Return arrays."""\n'
+        "    return arrays\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    relpath = "plugins/modules/algorithms/broken.py"
+
+    # The plugin's attributes are read from its source, so the import isn't executed
+    file_cache = {}
+    plugins = {}
+    assert add_module_plugin("broken_plugin_pkg", relpath, plugins, file_cache) == ""
+    assert "broken" in plugins["algorithms"]
+    assert relpath in file_cache
+
+    # Neither the static entry nor the cache is used when importing every module
+    error_message = add_module_plugin(
+        "broken_plugin_pkg", relpath, {}, file_cache, import_modules=True
+    )
+    assert "Failed importing 'broken'" in error_message
+
+
+# Readers without a module level 'source_names' warn each time their entry is built.
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_parse_module_plugin_matches_import():
+    """Ensure statically parsed module plugin entries match the imported entries."""
+    from importlib import resources
+    from os.path import relpath as osrelpath
+
+    from geoips.create_plugin_registries import (
+        _import_module_plugin,
+        _parse_module_plugin,
+    )
+
+    pkg_dir = resources.files("geoips")
+    num_parsed = 0
+    for abspath in sorted((pkg_dir / "plugins" / "modules").rglob("*.py")):
+        if abspath.name == "__init__.py":
+            continue
+        relpath = osrelpath(abspath, start=pkg_dir)
+        parsed = _parse_module_plugin("geoips", relpath, abspath)
+        if parsed is None:
+            # Can't be determined statically, these are imported instead.
+            continue
+        num_parsed += 1
+        imported = _import_module_plugin(
+            "geoips", relpath, abspath, splitext(abspath.name)[0]
+        )
+        assert parsed == imported, relpath
+    assert num_parsed
+
+
+def test_walk_plugins_matches_rglob():
+    """Ensure the single pass plugin walk finds the same plugin files as rglob."""
+    from importlib import resources
+
+    from geoips.create_plugin_registries import _walk_plugins
+
+    plugins_dir = resources.files("geoips") / "plugins"
+    walked = {".yaml": [], ".py": [], ".txt": []}
+    for suffix, filepath in _walk_plugins(str(plugins_dir)):
+        walked[suffix].append(filepath)
+    for suffix, filepaths in walked.items():
+        assert filepaths == [
+            str(path)
+            for path in plugins_dir.rglob(f"*{suffix}")
+            if path.name != "__init__.py"
+        ]
+    assert list(_walk_plugins(str(plugins_dir / "non_existent_dir"))) == []
@@ -51,3 +51,46 @@ class TestOutputCheckers:
         ):
             pytest.xfail(checker_name + " is not ready to be tested yet.")
         self.compare_plugin(tmp_path, plugin)
+
+
+@pytest.mark.parametrize(
+    "filename, checker_name",
+    [
+        ("output.png", "image"),
+        ("output.jpg", "image"),
+        ("output.tif", "geotiff"),
+        ("output.txt", "text"),
+        ("output.yaml", "text"),
+        ("output", "text"),
+        ("output.unknown", None),
+    ],
+)
+def test_identify_checker(tmp_path, filename, checker_name):
+    """Ensure identify_checker only selects checkers that handle the file."""
+    fname = tmp_path / filename
+    fname.write_text("Not a netcdf file\n")
+    if checker_name is None:
+        with pytest.raises(TypeError):
+            output_checkers.identify_checker(str(fname))
+    else:
+        assert output_checkers.identify_checker(str(fname)) == checker_name
+
+
+@pytest.mark.parametrize(
+    "contents, is_text",
+    [
+        (b"", True),
+        (b"plain text\n", True),
+        # Multi-byte character split across the 512 byte chunk which is inspected
+        (("a" * 511 + "é").encode("utf-8"), True),
+        (b"\x89PNG\r\n\x1a\n", False),
+        (b"text\x00with null bytes", False),
+    ],
+    ids=["empty", "ascii", "split-utf8", "invalid-utf8", "null-bytes"],
+)
+def test_text_correct_file_format(tmp_path, contents, is_text):
+    """Ensure the text output checker only accepts files containing text."""
+    fname = tmp_path / "output.txt"
+    fname.write_bytes(contents)
+    plugin = output_checkers.get_plugin("text")
+    assert plugin.module.correct_file_format(str(fname)) is is_text
@@ -103,3 +103,22 @@ def test_get_plugin(int_plug_tuple):
     elif test_result == "no_rebuild":
         with pytest.raises(PluginError):
             curr_interface.get_plugin(*plugin_name, rebuild_registries=False)
+
+
+def test_products_get_plugin_is_cached():
+    """Ensure cached product plugins are never modified by callers or overrides."""
+    products = interfaces.products
+    prod_plugin = products.get_plugin("abi", "Infrared")
+    assert ("abi", "Infrared") in products._plugin_cache
+    # Modify the returned plugin, that should not have an effect on later calls
+    prod_plugin["spec"]["variables"].append("B13BT")
+    override = {"Infrared": {"display_name": "Overridden"}}
+    override_plugin = products.get_plugin(
+        "abi", "Infrared", product_spec_override=override
+    )
+    assert override_plugin["spec"]["display_name"] == "Overridden"
+    unchanged_plugin = products.get_plugin("abi", "Infrared")
+    assert unchanged_plugin["spec"]["variables"] == ["B14BT"]
+    assert "display_name" not in unchanged_plugin["spec"]
+    assert unchanged_plugin.family == prod_plugin.family
+    assert unchanged_plugin is not products._plugin_cache[("abi", "Infrared")]
@@ -0,0 +1,35 @@
+# # # This source code is protected under the license referenced at
+# # # https://github.com/NRLMMD-GEOIPS.
+
+"""Unit tests for geoips.geoips_utils."""
+
+from geoips.geoips_utils import merge_nested_dicts
+
+
+def test_merge_nested_dicts_preserves_existing_values():
+    """Ensure only missing items are merged into dest, at every level."""
+    dest = {"a": 1, "nested": {"b": 2, "list": [1]}, "not_dict": "x"}
+    src = {
+        "a": 10,
+        "nested": {"b": 20, "c": 30, "list": [2]},
+        "not_dict": {"d": 40},
+        "e": {"f": 50},
+    }
+    merge_nested_dicts(dest, src)
+    assert dest == {
+        "a": 1,
+        "nested": {"b": 2, "list": [1], "c": 30},
+        "not_dict": "x",
+        "e": {"f": 50},
+    }
+    assert list(dest) == ["a", "nested", "not_dict", "e"]
+
+
+def test_merge_nested_dicts_not_in_place():
+    """Ensure dest is left untouched when in_place is False."""
+    dest = {"nested": {"b": 2}}
+    merged = merge_nested_dicts(dest, {"nested": {"c": 3}}, in_place=False)
+    assert merged == {"nested": {"b": 2, "c": 3}}
+    assert dest == {"nested": {"b": 2}}
+    assert merge_nested_dicts(dest, {"b": 1}, in_place=False, replace=True) == dest
+    assert merge_nested_dicts("not a dict", {"b": 1}, in_place=False) is None